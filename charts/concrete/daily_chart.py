@@ -8,7 +8,7 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import ClassVar, Dict
 
 from charts.base.chart_strategy_interface import ChartStrategyInterface, Series
 
@@ -20,32 +20,33 @@ class DailyChart(ChartStrategyInterface):
     EFFECTS:  Produces category totals for the given day.
     """
 
+    GRANULARITY: ClassVar[str] = "DAILY"
+
     def __init__(self, year: int, month: int, day: int) -> None:
         self._year = int(year)
         self._month = int(month)
         self._day = int(day)
+        self._title = f"Daily Totals — {self._year:04d}-{self._month:02d}-{self._day:02d}"
 
     def get_title(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns a title like 'Daily Totals — YYYY-MM-DD'.
         """
-        return f"Daily Totals — {self._year:04d}-{self._month:02d}-{self._day:02d}"
+        return self._title
 
     def granularity(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns 'DAILY'.
         """
-        return "DAILY"
+        return self.GRANULARITY
 
     def build_series(self, analytic_manager) -> Series:
         """
-        REQUIRES: analytic_manager.get_category_totals_day(year, month, day)
-        MODIFIES: none
+        REQUIRES: analytic_manager.cached_series(...) backed by get_category_totals_day(...)
+        MODIFIES: analytic_manager (series memo)
         EFFECTS:  Returns {category -> amount} for the specified day.
         """
-        return dict(
-            analytic_manager.get_category_totals_day(self._year, self._month, self._day)
-        )
+        return analytic_manager.cached_series(self.GRANULARITY, self._year, month=self._month, day=self._day)
 
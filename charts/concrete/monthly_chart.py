@@ -8,6 +8,8 @@
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 from charts.base.chart_strategy_interface import ChartStrategyInterface, Series
 
 
@@ -18,30 +20,31 @@ class MonthlyChart(ChartStrategyInterface):
     EFFECTS:  Produces category totals aggregated over the month.
     """
 
+    GRANULARITY: ClassVar[str] = "MONTHLY"
+
     def __init__(self, year: int, month: int) -> None:
         self._year = int(year)
         self._month = int(month)
+        self._title = f"Monthly Totals — {self._year:04d}-{self._month:02d}"
 
     def get_title(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns a title like 'Monthly Totals — YYYY-MM'.
         """
-        return f"Monthly Totals — {self._year:04d}-{self._month:02d}"
+        return self._title
 
     def granularity(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns 'MONTHLY'.
         """
-        return "MONTHLY"
+        return self.GRANULARITY
 
     def build_series(self, analytic_manager) -> Series:
         """
-        REQUIRES: analytic_manager.get_category_totals_month(year, month)
-        MODIFIES: none
+        REQUIRES: analytic_manager.cached_series(...) backed by get_category_totals_month(...)
+        MODIFIES: analytic_manager (series memo)
         EFFECTS:  Returns {category -> amount} for the specified month.
         """
-        return dict(
-            analytic_manager.get_category_totals_month(self._year, self._month)
-        )
+        return analytic_manager.cached_series(self.GRANULARITY, self._year, month=self._month)
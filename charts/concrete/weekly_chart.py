@@ -8,6 +8,8 @@
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 from charts.base.chart_strategy_interface import ChartStrategyInterface, Series
 
 
@@ -18,31 +20,32 @@ class WeeklyChart(ChartStrategyInterface):
     EFFECTS:  Produces category totals aggregated over that week.
     """
 
+    GRANULARITY: ClassVar[str] = "WEEKLY"
+
     def __init__(self, year: int, month: int, week: int) -> None:
         self._year = int(year)
         self._month = int(month)
         self._week = int(week)
+        self._title = f"Weekly Totals — {self._year:04d}-{self._month:02d} (Week {self._week})"
 
     def get_title(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns a title like 'Weekly Totals — YYYY-MM (Week W)'.
         """
-        return f"Weekly Totals — {self._year:04d}-{self._month:02d} (Week {self._week})"
+        return self._title
 
     def granularity(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns 'WEEKLY'.
         """
-        return "WEEKLY"
+        return self.GRANULARITY
 
     def build_series(self, analytic_manager) -> Series:
         """
-        REQUIRES: analytic_manager.get_category_totals_week(year, month, week)
-        MODIFIES: none
+        REQUIRES: analytic_manager.cached_series(...) backed by get_category_totals_week(...)
+        MODIFIES: analytic_manager (series memo)
         EFFECTS:  Returns {category -> amount} for the specified week.
         """
-        return dict(
-            analytic_manager.get_category_totals_week(self._year, self._month, self._week)
-        )
+        return analytic_manager.cached_series(self.GRANULARITY, self._year, month=self._month, week=self._week)
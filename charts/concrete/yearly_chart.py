@@ -8,6 +8,8 @@
 
 from __future__ import annotations
 
+from typing import ClassVar
+
 from charts.base.chart_strategy_interface import ChartStrategyInterface, Series
 
 
@@ -18,29 +20,30 @@ class YearlyChart(ChartStrategyInterface):
     EFFECTS:  Produces category totals aggregated over the year.
     """
 
+    GRANULARITY: ClassVar[str] = "YEARLY"
+
     def __init__(self, year: int) -> None:
         self._year = int(year)
+        self._title = f"Yearly Totals — {self._year:04d}"
 
     def get_title(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns a title like 'Yearly Totals — YYYY'.
         """
-        return f"Yearly Totals — {self._year:04d}"
+        return self._title
 
     def granularity(self) -> str:
         """
         REQUIRES: none
         EFFECTS:  Returns 'YEARLY'.
         """
-        return "YEARLY"
+        return self.GRANULARITY
 
     def build_series(self, analytic_manager) -> Series:
         """
-        REQUIRES: analytic_manager.get_category_totals_year(year)
-        MODIFIES: none
+        REQUIRES: analytic_manager.cached_series(...) backed by get_category_totals_year(...)
+        MODIFIES: analytic_manager (series memo)
         EFFECTS:  Returns {category -> amount} for the specified year.
         """
-        return dict(
-            analytic_manager.get_category_totals_year(self._year)
-        )
+        return analytic_manager.cached_series(self.GRANULARITY, self._year)
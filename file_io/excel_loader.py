@@ -5,13 +5,19 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+import os
+import json
 import shutil
+import sys
+import threading
 
-from openpyxl import load_workbook, Workbook
-from openpyxl.worksheet.worksheet import Worksheet
+# openpyxl is imported where a workbook is actually loaded/created (cold-start cost)
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
 
 from file_io.parser_interface import ParserInterface
 from models.transaction import Transaction
@@ -30,14 +36,100 @@ from utils.validator import (
     validate_backup_directory,
     validate_import_into_session,
     validate_fresh_session_paths,
+    validate_user_upload_path,
     validate_template_signature,
     validate_download_target_path,
     # Phase 2 additions:
     validate_date_matches_month,
     validate_upload_filesize,
+    ensure_directory_writable,
 )
 
 
+# Template month order (immutable; shared by every loader instance)
+MONTHS_IN_ORDER: Tuple[str, ...] = (
+    "JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE",
+    "JULY", "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER",
+)
+
+# Month key -> 0-based position in MONTHS_IN_ORDER
+MONTH_INDEX: Dict[str, int] = {m: i for i, m in enumerate(MONTHS_IN_ORDER)}
+
+# Month anchor rows in MONTHS_IN_ORDER order (row where the month name string appears)
+ANCHOR_ROWS: Tuple[int, ...] = (8, 72, 132, 196, 258, 322, 384, 448, 512, 574, 638, 700)
+
+# { month -> { day -> [slot0, slot1] } }, as returned by read_all()
+YearData = Dict[str, Dict[int, List[Optional[Transaction]]]]
+
+# Parsed read_all() results shared across loader instances:
+# resolved path -> ((st_mtime_ns, st_size), data). Stale entries miss on the stamp.
+_READ_CACHE: Dict[str, Tuple[Tuple[int, int], YearData]] = {}
+_READ_CACHE_MAX_ENTRIES: int = 8
+# Loaders run on the GUI thread and on pool threads; every _READ_CACHE access holds this.
+_READ_CACHE_LOCK = threading.Lock()
+
+# Raw TYPE cell -> canonical transaction type (shared string objects). Other
+# spellings are stripped/uppercased and looked up again; NONE/unknown are absent.
+TRANSACTION_TYPES: Dict[str, str] = {
+    spelling: key
+    for key in ("INCOME", "EXPENSE")
+    for spelling in (key, key.title(), key.lower())
+}
+
+# On-disk read_all() cache next to the workbook: JSON (data only, never code) of
+# {"format", "stamp", "months": {month: {day: [slot row or null, ...]}}} where a slot
+# row lists the Transaction fields in SIDECAR_FIELDS order.
+# Bump SIDECAR_FORMAT whenever YearData or Transaction changes shape.
+SIDECAR_SUFFIX: str = ".cache.json"
+SIDECAR_FORMAT: int = 2
+SIDECAR_FIELDS: Tuple[str, ...] = ("date", "day", "category", "amount", "type", "description")
+
+
+def cell_str(raw: object) -> str:
+    """EFFECTS: Returns raw as a string, or '' if None (no copy when already a str)."""
+    if raw is None:
+        return ""
+    if type(raw) is str:
+        return raw
+    return str(raw)
+
+
+def coerce_float(raw: object) -> float:
+    """EFFECTS: Best-effort float coercion for Excel values (currency-safe)."""
+    if raw is None:
+        return 0.0
+    if type(raw) is float or type(raw) is int:
+        return float(raw)
+    s = cell_str(raw).strip()
+    if not s:
+        return 0.0
+    if "$" in s:
+        s = s.replace("$", "")
+    if "," in s:
+        s = s.replace(",", "")
+    try:
+        return float(s)
+    except ValueError:
+        return 0.0
+
+
+def coerce_int(raw: object) -> int:
+    """EFFECTS: Best-effort int coercion for Excel values."""
+    if raw is None:
+        return 0
+    if type(raw) is int:
+        return raw
+    if type(raw) is float:
+        return int(raw)
+    s = cell_str(raw).strip()
+    if not s:
+        return 0
+    try:
+        return int(float(s))
+    except ValueError:
+        return 0
+
+
 class ExcelLoader(ParserInterface):
     """
     Abstraction Function:
@@ -46,6 +138,12 @@ class ExcelLoader(ParserInterface):
 
     Representation Invariant:
     - _wb and _ws are non-None only when a workbook is open.
+    - _read_only is True only while _wb was loaded in openpyxl read-only mode.
+    - _year_cache/_income_cache mirror B6/C5 of the open workbook, or are None.
+    - _modified is True iff the in-memory workbook has writes not yet saved;
+      the shared read cache is bypassed while it is set.
+    - _open_stamp is the backing file's (st_mtime_ns, st_size) taken when _wb was
+      loaded or last saved, or None; cache entries are matched against it.
     - Template signature must match TEMPLATE_MARKER_VALUE at TEMPLATE_MARKER_CELL.
     """
 
@@ -57,35 +155,76 @@ class ExcelLoader(ParserInterface):
     YEAR_CELL: str = "B6"
 
     # Month anchor rows (row where the month name string appears)
-    MONTH_ANCHOR_ROW: Dict[str, int] = {
-        "JANUARY": 8, "FEBRUARY": 72, "MARCH": 132, "APRIL": 196,
-        "MAY": 258, "JUNE": 322, "JULY": 384, "AUGUST": 448,
-        "SEPTEMBER": 512, "OCTOBER": 574, "NOVEMBER": 638, "DECEMBER": 700,
-    }
+    MONTH_ANCHOR_ROW: Dict[str, int] = dict(zip(MONTHS_IN_ORDER, ANCHOR_ROWS))
+
+    # Row of (day 1, slot 0) per month; (day d, slot s) is FIRST_SLOT_ROW + (d-1)*2 + s
+    FIRST_SLOT_ROW: Dict[str, int] = {m: a + 2 for m, a in MONTH_ANCHOR_ROW.items()}
 
     # Column mapping (1-based indices)
     COL: Dict[str, int] = {
         "DATE": 1, "DAY": 3, "CATEGORY": 4, "AMOUNT": 9, "TYPE": 10, "DESCRIPTION": 11,
     }
 
+    # Mapped columns in write order: DATE, DAY, CATEGORY, AMOUNT, TYPE, DESCRIPTION.
+    ROW_COLUMNS: Tuple[int, ...] = (
+        COL["DATE"], COL["DAY"], COL["CATEGORY"], COL["AMOUNT"], COL["TYPE"], COL["DESCRIPTION"],
+    )
+
+    # Right-most mapped column; bounds row sweeps in read_month().
+    MAX_COL: int = max(COL.values())
+    EMPTY_ROW: Tuple[None, ...] = (None,) * MAX_COL
+
+    # Tuple offsets (0-based) of TYPE, DATE, DAY, CATEGORY, AMOUNT, DESCRIPTION in a row.
+    SLOT_VALUE_INDEX: Tuple[int, ...] = (
+        COL["TYPE"] - 1, COL["DATE"] - 1, COL["DAY"] - 1,
+        COL["CATEGORY"] - 1, COL["AMOUNT"] - 1, COL["DESCRIPTION"] - 1,
+    )
+
     VALID_TYPES: set[str] = {"EXPENSE", "INCOME", "NONE"}
 
-    def __init__(self) -> None:
+    def __init__(self, use_sidecar: bool = False) -> None:
+        """
+        REQUIRES: none
+        MODIFIES: self
+        EFFECTS:  Creates a closed loader. With use_sidecar=True, read_all() also keeps
+                  an on-disk parse next to the workbook (see SIDECAR_SUFFIX) so a later
+                  process can skip the sheet sweep; meant for the session file only.
+        """
+        self._use_sidecar: bool = bool(use_sidecar)
         self._wb: Optional[Workbook] = None
         self._ws: Optional[Worksheet] = None
         self._path: Optional[Path] = None
+        self._read_only: bool = False
+        self._year_cache: Optional[int] = None
+        self._income_cache: Optional[float] = None
+        self._modified: bool = False
+        self._open_stamp: Optional[Tuple[int, int]] = None
 
     # --------------- Lifecycle ---------------
 
-    def open(self, file_path: str) -> None:
+    def open(self, file_path: str, read_only: bool = False) -> None:
         """
         REQUIRES: file_path points to readable .xlsx
         MODIFIES: self
-        EFFECTS:  Opens the workbook and stores handles.
+        EFFECTS:  Opens the workbook and stores handles. With read_only=True the
+                  sheet is streamed by openpyxl (much faster, lower memory); the
+                  first write call transparently re-opens it in read/write mode.
         """
+        from openpyxl import load_workbook
+
         validate_open_excel_path(file_path)
+        self.release_workbook()
         self._path = Path(file_path).resolve()
-        self._wb = load_workbook(filename=str(self._path))
+        self._read_only = bool(read_only)
+        # Stamp before loading: a write racing the load leaves an older stamp, which
+        # only costs a cache miss, never stale data under a newer stamp.
+        self._open_stamp = self.file_stamp()
+        if self._read_only:
+            self._wb = load_workbook(
+                filename=str(self._path), read_only=True, data_only=True, keep_links=False
+            )
+        else:
+            self._wb = load_workbook(filename=str(self._path))
         self._ws = self._wb.active
 
     def close(self) -> None:
@@ -94,8 +233,7 @@ class ExcelLoader(ParserInterface):
         MODIFIES: self
         EFFECTS:  Clears workbook handles (no file writes).
         """
-        self._wb = None
-        self._ws = None
+        self.release_workbook()
         self._path = None
 
     # --------------- Verification ---------------
@@ -113,23 +251,31 @@ class ExcelLoader(ParserInterface):
 
     def get_year(self) -> int:
         self.ensure_open()
-        raw = self._ws[self.YEAR_CELL].value  # type: ignore[index]
-        return int(float(raw))
+        if self._year_cache is None:
+            raw = self._ws[self.YEAR_CELL].value  # type: ignore[index]
+            self._year_cache = int(float(raw))
+        return self._year_cache
 
     def set_year(self, year: int) -> None:
         validate_year_value(year)
-        self.ensure_open()
+        self.ensure_writable()
         self._ws[self.YEAR_CELL] = int(year)  # type: ignore[index]
+        self._year_cache = int(year)
+        self._modified = True
 
     def get_current_income(self) -> float:
         self.ensure_open()
-        raw = self._ws[self.CURRENT_INCOME_CELL].value  # type: ignore[index]
-        return self.to_float(raw)
+        if self._income_cache is None:
+            raw = self._ws[self.CURRENT_INCOME_CELL].value  # type: ignore[index]
+            self._income_cache = coerce_float(raw)
+        return self._income_cache
 
     def set_current_income(self, income: float) -> None:
         validate_income_value(income)
-        self.ensure_open()
+        self.ensure_writable()
         self._ws[self.CURRENT_INCOME_CELL] = float(income)  # type: ignore[index]
+        self._income_cache = float(income)
+        self._modified = True
 
     # --------------- Month/Day I/O ---------------
 
@@ -140,18 +286,15 @@ class ExcelLoader(ParserInterface):
         """
         self.ensure_open()
         month_key = validate_month_name(month_name)  # normalize + validate
-        anchor = self.get_anchor_row(month_key)
+        cached = self.cached_year_data()
+        if cached is not None:
+            return self.copy_month_data(cached[month_key])
+
         year = self.get_year()
         day_count = GeneralHelper.get_days_in_month(month_key, year)
-
-        result: Dict[int, List[Optional[Transaction]]] = {}
-        for d in range(1, day_count + 1):
-            row_top = self.row_for_day(anchor, d, slot_index=0)
-            row_bottom = row_top + 1
-            slot0 = self.read_row_as_transaction(month_key, year, d, row_top)
-            slot1 = self.read_row_as_transaction(month_key, year, d, row_bottom)
-            result[d] = [slot0, slot1]
-        return result
+        first_row = self.FIRST_SLOT_ROW[month_key]
+        rows = self.iter_row_values(first_row, first_row + day_count * 2 - 1)
+        return self.read_month_rows(month_key, year, day_count, rows)
 
     def write_day_entry(
         self, month_name: str, day: int, slot_index: int, tx: Optional[Transaction]
@@ -161,54 +304,146 @@ class ExcelLoader(ParserInterface):
         MODIFIES: workbook
         EFFECTS:  Writes or clears a specific day/slot row.
         """
-        self.ensure_open()
-        month_key = validate_month_name(month_name)
-        validate_day_in_month(month_key, self.get_year(), day)
+        self.ensure_writable()
+        self.write_slot(validate_month_name(month_name), self.get_year(), day, slot_index, tx)
+
+    def write_slot(
+        self, month_key: str, year: int, day: int, slot_index: int, tx: Optional[Transaction]
+    ) -> None:
+        """
+        REQUIRES: workbook is writable; month_key normalized; year is the workbook year
+        MODIFIES: workbook
+        EFFECTS:  Validates and writes/clears one day/slot row without re-reading the year.
+        """
+        validate_day_in_month(month_key, year, day)
         validate_slot_index(slot_index)
         validate_transaction_or_none(tx)
 
         # Phase 2: ensure the tx.date belongs to the section being written
         if tx is not None:
-            validate_date_matches_month(month_key, tx.date, self.get_year())
+            validate_date_matches_month(month_key, tx.date, year)
 
-        anchor = self.get_anchor_row(month_key)
-        row = self.row_for_day(anchor, day, slot_index)
+        # Already validated above, so skip row_for_day's defensive checks.
+        row = self.FIRST_SLOT_ROW[month_key] + (day - 1) * 2 + slot_index
 
+        # Values follow ROW_COLUMNS order; a cleared slot is blank except TYPE=NONE.
         if tx is None:
-            self.clear_row(row)
-            self._ws.cell(row=row, column=self.COL["TYPE"]).value = "NONE"
-            return
-
-        self._ws.cell(row=row, column=self.COL["DATE"]).value = self.extract_day(tx.date)
-        self._ws.cell(row=row, column=self.COL["DAY"]).value = tx.day
-        self._ws.cell(row=row, column=self.COL["CATEGORY"]).value = tx.category
-        self._ws.cell(row=row, column=self.COL["AMOUNT"]).value = float(tx.amount)
-        self._ws.cell(row=row, column=self.COL["TYPE"]).value = tx.type.upper()
-        self._ws.cell(row=row, column=self.COL["DESCRIPTION"]).value = tx.description
+            values = (None, None, None, None, "NONE", None)
+        else:
+            values = (
+                self.extract_day(tx.date), tx.day, tx.category,
+                float(tx.amount), tx.type.upper(), tx.description,
+            )
+
+        cell = self._ws.cell  # type: ignore[union-attr]
+        for col, value in zip(self.ROW_COLUMNS, values):
+            cell(row=row, column=col).value = value
+        self._modified = True
 
     def read_all(self) -> Dict[str, Dict[int, List[Optional[Transaction]]]]:
         """
         REQUIRES: workbook is open
         EFFECTS:  Returns { month -> { day -> [slot0, slot1] } } for the whole year.
+                  Unchanged files are served from a cache keyed by mtime/size; the
+                  returned Transactions are always the caller's own copies.
         """
         self.ensure_open()
-        data: Dict[str, Dict[int, List[Optional[Transaction]]]] = {}
-        for month_key in self.months_in_order():
-            data[month_key] = self.read_month(month_key)
+        data, shared = self.load_year_data()
+        if shared:
+            return {m: self.copy_month_data(days) for m, days in data.items()}
         return data
 
-    def write_all(self, data: Dict[str, Dict[int, List[Optional[Transaction]]]]) -> None:
+    def iter_nonempty_transactions(self) -> Iterator[Transaction]:
         """
-        REQUIRES: data follows the schema
-        MODIFIES: workbook
-        EFFECTS:  Writes all months/days/slots back to the file buffer.
+        REQUIRES: workbook is open; callers treat the yielded transactions as read-only
+        EFFECTS:  Yields every filled slot in sheet order (month, day, slot 0 then 1).
+                  Unlike read_all(), cached year data is walked in place, not copied.
         """
         self.ensure_open()
-        for month_key, days in data.items():
-            month_norm = validate_month_name(month_key)
+        data, _ = self.load_year_data()
+        for days in data.values():
+            for slots in days.values():
+                for tx in slots:
+                    if tx is not None:
+                        yield tx
+
+    def load_year_data(self) -> Tuple[YearData, bool]:
+        """
+        REQUIRES: workbook is open
+        EFFECTS:  Returns (data, shared) for the whole year. shared is True when data
+                  is the cached parse, which callers must not mutate.
+        """
+        cached = self.cached_year_data()
+        if cached is not None:
+            return cached, True
+
+        stamp = None if self._modified else self._open_stamp
+        if stamp is not None and self._use_sidecar:
+            data = self.load_sidecar(stamp)
+            if data is not None:
+                self.store_year_data(stamp, data)
+                return data, True
+
+        year = self.get_year()
+
+        # (month_key, first slot row, day count) in sheet order
+        spans = []
+        for month_key in self.months_in_order():
+            spans.append((month_key, self.FIRST_SLOT_ROW[month_key], GeneralHelper.get_days_in_month(month_key, year)))
+
+        # One sequential sweep over the whole year; read-only worksheets re-parse
+        # the sheet XML on every iter_rows() call, so avoid one sweep per month.
+        # Per-month workers (one read-only handle each) are slower for the same
+        # reason: every worker re-parses the sheet up to its month under the GIL.
+        _, last_first_row, last_day_count = spans[-1]
+        rows = self.iter_row_values(spans[0][1], last_first_row + last_day_count * 2 - 1)
+
+        data: Dict[str, Dict[int, List[Optional[Transaction]]]] = {}
+        current_row = spans[0][1]
+        for month_key, first_row, day_count in spans:
+            for _ in range(first_row - current_row):  # skip month header rows
+                next(rows, None)
+            data[month_key] = self.read_month_rows(month_key, year, day_count, rows)
+            current_row = first_row + day_count * 2
+
+        # Only publish the parse if the file is still the one that was opened.
+        if stamp is not None and self.file_stamp() == stamp:
+            self.store_year_data(stamp, data)
+            if self._use_sidecar:
+                self.write_sidecar(stamp, data)
+            return data, True
+        return data, False
+
+    def write_all(
+        self,
+        data: Dict[str, Dict[int, List[Optional[Transaction]]]],
+        dirty: Optional[Iterable[Tuple[str, int, int]]] = None,
+    ) -> None:
+        """
+        REQUIRES: data follows the schema; months in data keys and dirty keys
+                  (month, day, slot) may use any spelling validate_month_name accepts
+        MODIFIES: workbook
+        EFFECTS:  Writes all months/days/slots back to the file buffer (blank slots
+                  become TYPE=NONE rows). With dirty given, only those slots are
+                  written, taken from data (absent from data → cleared).
+        """
+        self.ensure_writable()
+        year = self.get_year()
+        by_month = {validate_month_name(k): v for k, v in data.items()}
+        if dirty is not None:
+            keys = [(validate_month_name(m), day, slot) for m, day, slot in dirty]
+            # Sheet order keeps the row writes sequential.
+            keys.sort(key=lambda k: (MONTH_INDEX[k[0]], k[1], k[2]))
+            no_days: Dict[int, List[Optional[Transaction]]] = {}
+            for month_key, day, slot in keys:
+                slots = by_month.get(month_key, no_days).get(day)
+                tx = slots[slot] if slots is not None and 0 <= slot < len(slots) else None
+                self.write_slot(month_key, year, day, slot, tx)
+            return
+        for month_key, days in by_month.items():
             for day, slots in days.items():
                 for idx, tx in enumerate(slots):
-                    self.write_day_entry(month_norm, day, idx, tx)
+                    self.write_slot(month_key, year, day, idx, tx)
 
     # --------------- Persistence ---------------
 
@@ -218,10 +453,13 @@ class ExcelLoader(ParserInterface):
         MODIFIES: workbook file
         EFFECTS:  Saves the current workbook to the same path.
         """
-        self.ensure_open()
+        self.ensure_writable()
         if not self._path:
             raise ValidationError("No backing path associated with this workbook.")
+        self.invalidate_read_cache(str(self._path))
         self._wb.save(str(self._path))  # type: ignore[union-attr]
+        self._modified = False
+        self._open_stamp = self.file_stamp()
 
     def save_as(self, file_path: str) -> None:
         """
@@ -230,11 +468,16 @@ class ExcelLoader(ParserInterface):
         EFFECTS:  Saves the workbook to a new path.
         """
         validate_download_target_path(file_path)
-        self.ensure_open()
+        self.ensure_writable()
+        self.invalidate_read_cache(file_path)
         self._wb.save(file_path)  # type: ignore[union-attr]
 
     # --------------- Session helpers ---------------
 
+    def has_unsaved_changes(self) -> bool:
+        """EFFECTS: True iff cells/year/income were written since the last open or save."""
+        return self._modified
+
     def get_path(self) -> Optional[str]:
         """EFFECTS: Returns absolute path of the open workbook, else None."""
         return None if self._path is None else str(self._path)
@@ -256,7 +499,7 @@ class ExcelLoader(ParserInterface):
         backup_path = dst_dir / backup_name
 
         self.save()  # flush current buffer first
-        shutil.copy2(str(self._path), str(backup_path))
+        shutil.copyfile(self._path, backup_path)
         return str(backup_path)
 
     def prepare_fresh_session(self, template_path: str, storage_dir: str) -> str:
@@ -266,14 +509,43 @@ class ExcelLoader(ParserInterface):
         EFFECTS:  Copy template -> storage_dir/user_data.xlsx, open it, return its path.
         """
         validate_fresh_session_paths(template_path, storage_dir)
+        return self.install_session_file(
+            template_path, storage_dir, "Copied session file failed template verification."
+        )
+
+    def prepare_imported_session(self, source_path: str, storage_dir: str) -> str:
+        """
+        REQUIRES: source_path is the user's uploaded workbook; storage_dir writable
+        MODIFIES: filesystem
+        EFFECTS:  Copy upload -> storage_dir/user_data.xlsx, open it, return its path.
+                  Validation errors describe the uploaded file, not the template.
+        """
+        validate_user_upload_path(source_path)
+        validate_upload_filesize(source_path)
+        validate_template_signature(source_path)
+        ensure_directory_writable(Path(storage_dir))
+        return self.install_session_file(
+            source_path, storage_dir, "The imported file failed template verification after copying."
+        )
 
-        src = Path(template_path).resolve()
+    def install_session_file(self, source_path: str, storage_dir: str, failure_message: str) -> str:
+        """
+        REQUIRES: source_path and storage_dir already validated by the caller
+        MODIFIES: filesystem; self
+        EFFECTS:  Copies source_path over storage_dir/user_data.xlsx, opens it read-only
+                  and verifies the template; on failure removes the copy and raises
+                  ValidationError(failure_message).
+        """
+        src = Path(source_path).resolve()
         storage = Path(storage_dir).resolve()
         dst = storage / "user_data.xlsx"
 
-        shutil.copy2(str(src), str(dst))
+        self.invalidate_read_cache(str(dst))
+        self.discard_sidecar(dst)
+        shutil.copyfile(src, dst)
 
-        self.open(str(dst))
+        # Read-only is enough to verify; later writes reopen via ensure_writable().
+        self.open(str(dst), read_only=True)
 
         if not self.verify_template():
             self.close()
@@ -281,7 +553,7 @@ class ExcelLoader(ParserInterface):
                 dst.unlink(missing_ok=True)  # type: ignore[arg-type]
             except Exception:
                 pass
-            raise ValidationError("Copied session file failed template verification.")
+            raise ValidationError(failure_message)
 
         return str(dst)
 
@@ -290,6 +562,7 @@ class ExcelLoader(ParserInterface):
         REQUIRES: workbook is open; source_path points to valid template
         MODIFIES: workbook file
         EFFECTS:  Overwrites the session file with source_path and re-opens it.
+                  Unsaved edits in the current workbook are discarded.
         """
         if self._path is None:
             raise ValidationError("No session file is open. Start a fresh session first.")
@@ -300,8 +573,14 @@ class ExcelLoader(ParserInterface):
         validate_import_into_session(self, source_path)
         src = Path(source_path).resolve()
 
-        self.save()
-        shutil.copy2(str(src), str(self._path))
+        # The session is being replaced, so don't save it first; just let go
+        # of the open workbook (releases the file handle before the copy).
+        self.release_workbook()
+        # A same-size copy within the filesystem's mtime granularity would keep
+        # the old stamp, so drop the cached parse explicitly.
+        self.invalidate_read_cache(str(self._path))
+        self.discard_sidecar(self._path)
+        shutil.copyfile(src, self._path)
         self.open(str(self._path))
 
     # --------------- Internals (renamed to Java-like semantics) ---------------
@@ -314,6 +593,163 @@ class ExcelLoader(ParserInterface):
         if self._wb is None or self._ws is None:
             raise ValidationError("Workbook is not open. Call open(file_path) first.")
 
+    def ensure_writable(self) -> None:
+        """
+        REQUIRES: workbook is open
+        MODIFIES: self
+        EFFECTS:  Re-opens a read-only workbook in read/write mode (lazily, on the
+                  first write); no-op when already writable.
+        """
+        self.ensure_open()
+        if self._read_only:
+            self.open(str(self._path), read_only=False)
+
+    def release_workbook(self) -> None:
+        """
+        MODIFIES: self
+        EFFECTS:  Drops workbook handles; read-only workbooks keep the file open
+                  until closed explicitly, so close those first.
+        """
+        if self._wb is not None and self._read_only:
+            try:
+                self._wb.close()
+            except Exception:
+                pass
+        self._wb = None
+        self._ws = None
+        self._read_only = False
+        self._year_cache = None
+        self._income_cache = None
+        self._modified = False
+        self._open_stamp = None
+
+    def file_stamp(self) -> Optional[Tuple[int, int]]:
+        """EFFECTS: Returns (st_mtime_ns, st_size) of the backing file, or None if unavailable."""
+        if self._path is None:
+            return None
+        try:
+            st = self._path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def cached_year_data(self) -> Optional[YearData]:
+        """
+        EFFECTS: Returns the shared parsed year for the backing file if it was parsed
+                 from the same file version this workbook was opened from and this
+                 workbook has no unsaved writes; else None.
+                 Callers must copy before handing the data out.
+        """
+        if self._modified or self._open_stamp is None:
+            return None
+        with _READ_CACHE_LOCK:
+            entry = _READ_CACHE.get(str(self._path))
+        if entry is None or entry[0] != self._open_stamp:
+            return None
+        return entry[1]
+
+    def store_year_data(self, stamp: Tuple[int, int], data: YearData) -> None:
+        """MODIFIES: shared read cache; EFFECTS: Records data as the parse of the backing file at stamp."""
+        key = str(self._path)
+        with _READ_CACHE_LOCK:
+            _READ_CACHE.pop(key, None)
+            while len(_READ_CACHE) >= _READ_CACHE_MAX_ENTRIES:
+                _READ_CACHE.pop(next(iter(_READ_CACHE)))
+            _READ_CACHE[key] = (stamp, data)
+
+    def invalidate_read_cache(self, file_path: str) -> None:
+        """MODIFIES: shared read cache; EFFECTS: Drops any cached parse of file_path."""
+        key = str(Path(file_path).resolve())
+        with _READ_CACHE_LOCK:
+            _READ_CACHE.pop(key, None)
+
+    def sidecar_path(self, file_path: Path) -> Path:
+        """EFFECTS: Returns the read_all() sidecar path for file_path (e.g., user_data.cache.json)."""
+        return file_path.with_suffix(SIDECAR_SUFFIX)
+
+    def load_sidecar(self, stamp: Tuple[int, int]) -> Optional[YearData]:
+        """
+        REQUIRES: workbook is open and bound to a path
+        EFFECTS:  Returns the sidecar's parsed year if it was written for stamp;
+                  None if missing, stale, or unreadable.
+        """
+        try:
+            payload = json.loads(self.sidecar_path(self._path).read_bytes())  # type: ignore[arg-type]
+            if payload["format"] != SIDECAR_FORMAT or tuple(payload["stamp"]) != stamp:
+                return None
+            intern = sys.intern
+            data: YearData = {}
+            for month_key, days in payload["months"].items():
+                month: Dict[int, List[Optional[Transaction]]] = {}
+                for day, rows in days.items():
+                    slots: List[Optional[Transaction]] = []
+                    for row in rows:
+                        if row is None:
+                            slots.append(None)
+                            continue
+                        date_s, day_name, category, amount, t, desc = row
+                        slots.append(Transaction.from_normalized(
+                            str(date_s), str(day_name), intern(str(category)),
+                            float(amount), intern(str(t)), str(desc),
+                        ))
+                    month[int(day)] = slots
+                data[intern(str(month_key))] = month
+        except Exception:
+            return None
+        return data
+
+    def write_sidecar(self, stamp: Tuple[int, int], data: YearData) -> None:
+        """
+        REQUIRES: data is the parse of the backing file at stamp
+        MODIFIES: filesystem (sidecar next to the workbook)
+        EFFECTS:  Best-effort write of the read_all() sidecar; failures are ignored.
+        """
+        target = self.sidecar_path(self._path)  # type: ignore[arg-type]
+        tmp = target.with_name(target.name + ".tmp")
+        months = {
+            month_key: {
+                day: [
+                    None if tx is None else [getattr(tx, f) for f in SIDECAR_FIELDS]
+                    for tx in slots
+                ]
+                for day, slots in days.items()
+            }
+            for month_key, days in data.items()
+        }
+        payload = {"format": SIDECAR_FORMAT, "stamp": list(stamp), "months": months}
+        try:
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, target)
+        except Exception:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def discard_sidecar(self, file_path: Path) -> None:
+        """MODIFIES: filesystem; EFFECTS: Removes file_path's read_all() sidecar if present."""
+        try:
+            self.sidecar_path(file_path).unlink()
+        except OSError:
+            pass
+
+    def copy_month_data(
+        self, days: Dict[int, List[Optional[Transaction]]]
+    ) -> Dict[int, List[Optional[Transaction]]]:
+        """
+        EFFECTS: Returns a copy of {day -> slots} with fresh slot lists and fresh
+                 Transactions, so callers can mutate them without touching the cache.
+        """
+        fresh = Transaction.from_normalized
+        return {
+            d: [
+                None if tx is None else
+                fresh(tx.date, tx.day, tx.category, tx.amount, tx.type, tx.description)
+                for tx in slots
+            ]
+            for d, slots in days.items()
+        }
+
     def normalize_month(self, month_name: str) -> str:
         """
         REQUIRES: month_name is non-empty
@@ -321,13 +757,13 @@ class ExcelLoader(ParserInterface):
         NOTE: Public callers should prefer validator.validate_month_name().
         """
         key = month_name.strip().upper()
-        if key not in self.MONTH_ANCHOR_ROW:
+        if key not in MONTH_INDEX:
             raise ValidationError(f"Unknown month: {month_name}")
         return key
 
     def get_anchor_row(self, month_key: str) -> int:
         """EFFECTS: Returns the anchor row for the month header."""
-        return self.MONTH_ANCHOR_ROW[month_key]
+        return ANCHOR_ROWS[MONTH_INDEX[month_key]]
 
     def row_for_day(self, anchor_row: int, day: int, slot_index: int) -> int:
         """
@@ -340,18 +776,42 @@ class ExcelLoader(ParserInterface):
             raise ValidationError("slot_index must be 0 or 1")
         return anchor_row + 2 + (day - 1) * 2 + slot_index
 
-    def months_in_order(self) -> List[str]:
-        """EFFECTS: Returns the months in template order."""
-        return [
-            "JANUARY", "FEBRUARY", "MARCH", "APRIL", "MAY", "JUNE",
-            "JULY", "AUGUST", "SEPTEMBER", "OCTOBER", "NOVEMBER", "DECEMBER"
-        ]
+    def months_in_order(self) -> Tuple[str, ...]:
+        """EFFECTS: Returns the months in template order (shared immutable tuple)."""
+        return MONTHS_IN_ORDER
 
     def clear_row(self, row: int) -> None:
         """MODIFIES: worksheet; EFFECTS: Clears all mapped columns in the row."""
         for col in self.COL.values():
             self._ws.cell(row=row, column=col).value = None  # type: ignore[union-attr]
 
+    def iter_row_values(self, min_row: int, max_row: int) -> Iterator[Tuple[object, ...]]:
+        """
+        REQUIRES: workbook is open; min_row <= max_row
+        EFFECTS:  Streams rows min_row..max_row as value tuples covering columns
+                  1..MAX_COL (missing cells are None).
+        """
+        return self._ws.iter_rows(  # type: ignore[union-attr]
+            min_row=min_row, max_row=max_row,
+            min_col=1, max_col=self.MAX_COL, values_only=True,
+        )
+
+    def read_month_rows(
+        self, month_key: str, year: int, day_count: int, rows: Iterator[Tuple[object, ...]]
+    ) -> Dict[int, List[Optional[Transaction]]]:
+        """
+        REQUIRES: rows is positioned on the month's day-1/slot-0 row
+        MODIFIES: rows (consumes day_count * 2 rows)
+        EFFECTS:  Returns {day -> [slot0, slot1]} parsed from the streamed rows.
+        """
+        empty = self.EMPTY_ROW
+        result: Dict[int, List[Optional[Transaction]]] = {}
+        for d in range(1, day_count + 1):
+            slot0 = self.values_to_transaction(month_key, year, d, next(rows, empty))
+            slot1 = self.values_to_transaction(month_key, year, d, next(rows, empty))
+            result[d] = [slot0, slot1]
+        return result
+
     def read_row_as_transaction(
         self, month_key: str, year: int, day: int, row: int
     ) -> Optional[Transaction]:
@@ -359,71 +819,60 @@ class ExcelLoader(ParserInterface):
         REQUIRES: worksheet row corresponds to a valid slot
         EFFECTS:  Parses the row into a Transaction or returns None for blanks/NONE.
         """
-        t = self.safe_cell_str(row, self.COL["TYPE"]).strip().upper()
-        date_cell = self.safe_cell_str(row, self.COL["DATE"]).strip()
-        day_name = self.safe_cell_str(row, self.COL["DAY"]).strip()
-        category = self.safe_cell_str(row, self.COL["CATEGORY"]).strip()
-        amount_raw = self._ws.cell(row=row, column=self.COL["AMOUNT"]).value  # type: ignore[union-attr]
-        desc = self.safe_cell_str(row, self.COL["DESCRIPTION"]).strip()
+        values = next(self.iter_row_values(row, row), self.EMPTY_ROW)
+        return self.values_to_transaction(month_key, year, day, values)
 
-        is_all_blank = (
-            t == "" and date_cell == "" and day_name == "" and category == "" and
-            desc == "" and (amount_raw is None or str(amount_raw).strip() == "")
-        )
-        if t == "NONE" or (t == "" and is_all_blank):
-            return None
-        if t not in self.VALID_TYPES:
-            return None
+    def values_to_transaction(
+        self, month_key: str, year: int, day: int, values: Tuple[object, ...]
+    ) -> Optional[Transaction]:
+        """
+        REQUIRES: values covers columns 1..MAX_COL of one slot row (see iter_row_values)
+        EFFECTS:  Parses the row values into a Transaction or returns None for blanks/NONE.
+        """
+        t_idx, date_idx, day_idx, category_idx, amount_idx, desc_idx = self.SLOT_VALUE_INDEX
 
-        day_number = self.to_int(date_cell) if date_cell else day
+        # TYPE decides first: blank, NONE and unknown types are all "no transaction",
+        # which covers most template rows without normalizing the other cells.
+        t_raw = values[t_idx]
+        if t_raw is None:
+            return None
+        t = TRANSACTION_TYPES.get(t_raw) if type(t_raw) is str else None
+        if t is None:
+            t = TRANSACTION_TYPES.get(cell_str(t_raw).strip().upper())
+            if t is None:
+                return None
+
+        date_cell = cell_str(values[date_idx]).strip()
+        day_name = cell_str(values[day_idx]).strip()
+        category = sys.intern(cell_str(values[category_idx]).strip().upper())
+        desc = cell_str(values[desc_idx]).strip()
+
+        day_number = coerce_int(date_cell) if date_cell else day
         date_str = self.date_to_string(year, month_key, day_number)
-        amount_val = self.to_float(amount_raw)
+        amount_val = coerce_float(values[amount_idx])
 
-        return Transaction(
-            date=date_str, day=day_name, category=category,
-            amount=amount_val, type=t, description=desc,
-        )
+        # Every field is already in Transaction's normalized form.
+        return Transaction.from_normalized(date_str, day_name, category, amount_val, t, desc)
 
     def safe_cell_str(self, row: int, col: int) -> str:
         """EFFECTS: Returns the cell value as a string, or '' if None."""
-        val = self._ws.cell(row=row, column=col).value  # type: ignore[union-attr]
-        return "" if val is None else str(val)
+        return cell_str(self._ws.cell(row=row, column=col).value)  # type: ignore[union-attr]
 
     def to_float(self, raw) -> float:
-        """EFFECTS: Best-effort float coercion for Excel values (currency-safe)."""
-        if raw is None:
-            return 0.0
-        s = str(raw).strip()
-        if s == "":
-            return 0.0
-        s = s.replace("$", "").replace(",", "")
-        try:
-            return float(s)
-        except ValueError:
-            return 0.0
+        """EFFECTS: Best-effort float coercion for Excel values (see coerce_float)."""
+        return coerce_float(raw)
 
     def to_int(self, raw) -> int:
-        """EFFECTS: Best-effort int coercion for Excel values."""
-        if raw is None or str(raw).strip() == "":
-            return 0
-        try:
-            return int(float(str(raw)))
-        except ValueError:
-            return 0
+        """EFFECTS: Best-effort int coercion for Excel values (see coerce_int)."""
+        return coerce_int(raw)
 
     def date_to_string(self, year: int, month_key: str, day_number: int) -> str:
         """EFFECTS: Returns 'YYYY-MM-DD' using template month key."""
-        month_num = self.month_to_number(month_key)
-        return f"{year:04d}-{month_num:02d}-{day_number:02d}"
+        return f"{year:04d}-{MONTH_INDEX[month_key] + 1:02d}-{day_number:02d}"
 
     def month_to_number(self, month_key: str) -> int:
         """EFFECTS: Maps template month key to 1–12."""
-        mapping = {
-            "JANUARY": 1, "FEBRUARY": 2, "MARCH": 3, "APRIL": 4,
-            "MAY": 5, "JUNE": 6, "JULY": 7, "AUGUST": 8,
-            "SEPTEMBER": 9, "OCTOBER": 10, "NOVEMBER": 11, "DECEMBER": 12
-        }
-        return mapping[month_key]
+        return MONTH_INDEX[month_key] + 1
 
     def extract_day(self, date_str: str) -> int:
         """EFFECTS: Parses 'YYYY-MM-DD' and returns DD as int; 0 on failure."""
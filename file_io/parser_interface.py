@@ -24,12 +24,13 @@ class ParserInterface(ABC):
     # ---------------- Lifecycle ----------------
 
     @abstractmethod
-    def open(self, file_path: str) -> None:
+    def open(self, file_path: str, read_only: bool = False) -> None:
         """
         REQUIRES: file_path points to an existing file (or a new path if the
                   implementation supports creating a new workbook)
         MODIFIES: internal state (stores open handle)
-        EFFECTS:  Opens the file for subsequent reads/writes.
+        EFFECTS:  Opens the file for subsequent reads/writes. read_only=True is a
+                  hint that the caller will only read, allowing a faster path.
         """
         raise NotImplementedError
 
@@ -1,7 +1,6 @@
 # File: main.py
 import sys
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from managers.screen_manager import ScreenManager
 
 def main():
     app = QApplication(sys.argv)
@@ -15,6 +14,9 @@ def main():
         "• Download Template: save a blank template to fill later."
     )
 
+    # Deferred until the welcome message is up: pulls in the screens and openpyxl.
+    from managers.screen_manager import ScreenManager
+
     sm = ScreenManager()
     sm.show_welcome()
 
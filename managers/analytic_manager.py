@@ -2,14 +2,59 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Iterable, Tuple
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, NamedTuple, Optional, Iterable, Sequence, Tuple
 from datetime import datetime, date
+from functools import lru_cache
+from pathlib import Path
 
-from file_io.excel_loader import ExcelLoader
+from file_io.excel_loader import ExcelLoader, MONTHS_IN_ORDER
 from models.transaction import Transaction
 from models.financial_summary import FinancialSummary
 from utils.validator import ValidationError
 
+# EXPENSE rows of one month as parallel columns: (days, categories, amounts)
+ExpenseColumns = Tuple[List[int], List[str], List[float]]
+
+# Transaction types the analytics count; loader types are already upper-cased.
+_ALLOWED_TYPES = frozenset(("EXPENSE", "INCOME"))
+
+# One pass over the year: ({month -> (income, expense)}, (year income, year expense))
+YearRollup = Tuple[Dict[str, Tuple[float, float]], Tuple[float, float]]
+
+
+class SeriesColumns(NamedTuple):
+    """
+    Income/expense series as parallel columns; row i is
+    (labels[i], income[i], expense[i], net[i]).
+    """
+    labels: List[str]
+    income: List[float]
+    expense: List[float]
+    net: List[float]
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(datestr: str) -> date:
+    """
+    REQUIRES: datestr is 'YYYY-MM-DD'
+    EFFECTS:  Returns a date object; raises on failure. Memoized: a year has at most
+              366 distinct dates, and zero-padded ones skip strptime.
+    """
+    if len(datestr) == 10 and datestr[4] == "-" and datestr[7] == "-":
+        return date.fromisoformat(datestr)
+    return datetime.strptime(datestr, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=4096)
+def _iso_week_label(datestr: str) -> str:
+    """
+    REQUIRES: datestr is 'YYYY-MM-DD'
+    EFFECTS:  Returns the ISO week label 'YYYY-Www' for the date; raises on failure.
+    """
+    iso = _parse_date(datestr).isocalendar()
+    return f"{iso.year}-W{iso.week:02d}"
+
 
 class AnalyticManager:
     """
@@ -18,6 +63,8 @@ class AnalyticManager:
     EFFECTS:  Provides read-only analytics over the active session to power charts/summary.
     """
 
+    SERIES_CACHE_MAX_ENTRIES: int = 128
+
     def __init__(self, session_path: Optional[str] = None) -> None:
         """
         REQUIRES: session_path is None or points to an existing workbook file.
@@ -25,6 +72,14 @@ class AnalyticManager:
         EFFECTS:  Initializes the manager with an optional session path.
         """
         self._session_path: Optional[str] = session_path
+        # Memos below are valid for one data version (see _data_version()).
+        self._cache_version: Optional[Tuple] = None
+        self._year: Optional[int] = None
+        self._template_ok: Optional[bool] = None
+        self._series_cache: Dict[Tuple, Dict[str, float]] = {}
+        self._month_cache: Dict[str, List[Transaction]] = {}
+        self._expense_cache: Dict[str, ExpenseColumns] = {}
+        self._rollup: Optional[YearRollup] = None
 
     # ------------ Session wiring ------------
 
@@ -35,6 +90,15 @@ class AnalyticManager:
         EFFECTS:  Updates the active session path.
         """
         self._session_path = session_path
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        MODIFIES: self
+        EFFECTS:  Drops memoized series/month reads so the next request re-reads the workbook.
+        """
+        self._cache_version = None
+        self._clear_memos()
 
     def get_session_path(self) -> Optional[str]:
         """
@@ -56,14 +120,16 @@ class AnalyticManager:
     def get_year(self) -> int:
         """
         REQUIRES: active session
-        EFFECTS:  Returns the workbook's year value.
-        """
-        path = self.require_active_session()
-        loader = ExcelLoader()
-        loader.open(path)
-        year = loader.get_year()
-        loader.close()
-        return year
+        EFFECTS:  Returns the workbook's year value (memoized per data version).
+        """
+        self._sync_cache_version()
+        if self._year is None:
+            path = self.require_active_session()
+            loader = ExcelLoader()
+            loader.open(path, read_only=True)
+            self._year = loader.get_year()
+            loader.close()
+        return self._year
 
     def compute_financial_summary(self) -> FinancialSummary:
         """
@@ -72,16 +138,14 @@ class AnalyticManager:
         """
         year = self.get_year()
 
-        totals = self.get_monthly_series()  # [{month_key, income, expense, net}, ...]
-        total_income = sum(m["income"] for m in totals)
-        total_expense = sum(m["expense"] for m in totals)
-        net = total_income - total_expense
+        by_month, _ = self._aggregate_all()
+        total_income = sum(inc for inc, _ in by_month.values())
+        total_expense = sum(exp for _, exp in by_month.values())
 
         return FinancialSummary(
             year=year,
             total_income=total_income,
             total_expense=total_expense,
-            net_savings=net,
             notes=None,
         )
 
@@ -92,9 +156,7 @@ class AnalyticManager:
         REQUIRES: active session; month_key is a valid template month name (e.g., 'JANUARY')
         EFFECTS:  Returns {'income': x, 'expense': y, 'net': x - y} for the given month.
         """
-        txs = self._iter_month_transactions(month_key)
-        income = sum(t.amount for t in txs if t.type.strip().upper() == "INCOME")
-        expense = sum(t.amount for t in txs if t.type.strip().upper() == "EXPENSE")
+        income, expense = self._income_expense(self._iter_month_transactions(month_key))
         return {"income": income, "expense": expense, "net": income - expense}
 
     def get_monthly_series(self) -> List[Dict[str, float]]:
@@ -103,17 +165,7 @@ class AnalyticManager:
         EFFECTS:  Returns a list of dicts in template order:
                   [{'month': 'JANUARY', 'income': ..., 'expense': ..., 'net': ...}, ...]
         """
-        path = self.require_active_session()
-        loader = ExcelLoader()
-        loader.open(path)
-        months = loader.months_in_order()
-        loader.close()
-
-        series: List[Dict[str, float]] = []
-        for m in months:
-            t = self.get_month_totals(m)
-            series.append({"month": m, "income": t["income"], "expense": t["expense"], "net": t["net"]})
-        return series
+        return self._series_rows("month", self.get_monthly_series_columns())
 
     def get_daily_series(self, month_key: str) -> List[Dict[str, float]]:
         """
@@ -121,24 +173,7 @@ class AnalyticManager:
         EFFECTS:  Returns daily income/expense for a month as:
                   [{'date': 'YYYY-MM-DD', 'income': x, 'expense': y, 'net': x - y}, ...]
         """
-        txs = list(self._iter_month_transactions(month_key))
-        by_day: Dict[str, Dict[str, float]] = {}
-        for t in txs:
-            d = t.date
-            if d not in by_day:
-                by_day[d] = {"income": 0.0, "expense": 0.0}
-            if t.type.strip().upper() == "INCOME":
-                by_day[d]["income"] += t.amount
-            elif t.type.strip().upper() == "EXPENSE":
-                by_day[d]["expense"] += t.amount
-
-        # Sort by date ascending
-        items = []
-        for d in sorted(by_day.keys(), key=lambda s: self._safe_date_key(s)):
-            inc = by_day[d]["income"]
-            exp = by_day[d]["expense"]
-            items.append({"date": d, "income": inc, "expense": exp, "net": inc - exp})
-        return items
+        return self._series_rows("date", self.get_daily_series_columns(month_key))
 
     def get_weekly_series(self, month_key: str) -> List[Dict[str, float]]:
         """
@@ -146,101 +181,380 @@ class AnalyticManager:
         EFFECTS:  Buckets the month by ISO week:
                   [{'iso_week': 'YYYY-Www', 'income': x, 'expense': y, 'net': x - y}, ...]
         """
-        txs = list(self._iter_month_transactions(month_key))
-        buckets: Dict[str, Dict[str, float]] = {}
-        for t in txs:
-            dt = self._safe_parse_date(t.date)
-            iso_label = f"{dt.isocalendar().year}-W{dt.isocalendar().week:02d}"
-            if iso_label not in buckets:
-                buckets[iso_label] = {"income": 0.0, "expense": 0.0}
-            if t.type.strip().upper() == "INCOME":
-                buckets[iso_label]["income"] += t.amount
-            elif t.type.strip().upper() == "EXPENSE":
-                buckets[iso_label]["expense"] += t.amount
-
-        items = []
-        for k in sorted(buckets.keys()):
-            inc = buckets[k]["income"]
-            exp = buckets[k]["expense"]
-            items.append({"iso_week": k, "income": inc, "expense": exp, "net": inc - exp})
-        return items
-
-    def get_category_totals_year(self) -> Dict[str, float]:
+        return self._series_rows("iso_week", self.get_weekly_series_columns(month_key))
+
+    def get_monthly_series_columns(self) -> SeriesColumns:
+        """
+        REQUIRES: active session
+        EFFECTS:  Returns get_monthly_series() as SeriesColumns labelled by month name.
+        """
+        by_month, _ = self._aggregate_all()
+        return self._series_columns(MONTHS_IN_ORDER, by_month)
+
+    def get_daily_series_columns(self, month_key: str) -> SeriesColumns:
+        """
+        REQUIRES: active session; valid month_key
+        EFFECTS:  Returns get_daily_series(month_key) as SeriesColumns labelled
+                  'YYYY-MM-DD', sorted by date ascending.
+        """
+        by_day = self._bucket_income_expense(
+            (t.date, t) for t in self._iter_month_transactions(month_key)
+        )
+        return self._series_columns(sorted(by_day, key=self._safe_date_key), by_day)
+
+    def get_weekly_series_columns(self, month_key: str) -> SeriesColumns:
+        """
+        REQUIRES: active session; valid month_key
+        EFFECTS:  Returns get_weekly_series(month_key) as SeriesColumns labelled 'YYYY-Www'.
+        """
+        buckets = self._bucket_income_expense(
+            (_iso_week_label(t.date), t) for t in self._iter_month_transactions(month_key)
+        )
+        return self._series_columns(sorted(buckets), buckets)
+
+    def get_category_totals_year(self, year: Optional[int] = None) -> Dict[str, float]:
         """
         REQUIRES: active session
         EFFECTS:  Returns total EXPENSE by category for the whole year
                   (INCOME is excluded from category rollups by design).
-        """
-        totals: Dict[str, float] = {}
-        for t in self._iter_all_transactions():
-            ttype = t.type.strip().upper()
-            if ttype != "EXPENSE":
-                continue
-            key = (t.category or "").strip().upper() or "MISCELLANEOUS"
-            totals[key] = totals.get(key, 0.0) + t.amount
-        return totals
+                  Returns {} if year is given and is not the workbook's year.
+        """
+        if year is not None and int(year) != self.get_year():
+            return {}
+        if not self._load_all_months():
+            return {}
+        totals: DefaultDict[str, float] = defaultdict(float)
+        for month_key in MONTHS_IN_ORDER:
+            days, cats, amounts = self._month_expenses(month_key)
+            self._sum_by_category(totals, days, cats, amounts)
+        return dict(totals)
+
+    def get_category_totals_month(self, year: int, month: int) -> Dict[str, float]:
+        """
+        REQUIRES: active session; 1 <= month <= 12
+        EFFECTS:  Returns total EXPENSE by category for the given month.
+        """
+        if int(year) != self.get_year():
+            return {}
+        days, cats, amounts = self._month_expenses(self._month_key(month))
+        return dict(self._sum_by_category(defaultdict(float), days, cats, amounts))
+
+    def get_category_totals_week(self, year: int, month: int, week: int) -> Dict[str, float]:
+        """
+        REQUIRES: active session; 1 <= month <= 12; week >= 1
+        EFFECTS:  Returns total EXPENSE by category for week W of the month,
+                  where week W covers days 7*(W-1)+1 .. 7*W.
+        """
+        if int(year) != self.get_year():
+            return {}
+        first_day = (int(week) - 1) * 7 + 1
+        last_day = first_day + 6
+        days, cats, amounts = self._month_expenses(self._month_key(month))
+        return dict(self._sum_by_category(defaultdict(float), days, cats, amounts, (first_day, last_day)))
+
+    def get_category_totals_day(self, year: int, month: int, day: int) -> Dict[str, float]:
+        """
+        REQUIRES: active session; year/month/day form a valid date
+        EFFECTS:  Returns total EXPENSE by category for the given day.
+        """
+        if int(year) != self.get_year():
+            return {}
+        target = int(day)
+        days, cats, amounts = self._month_expenses(self._month_key(month))
+        return dict(self._sum_by_category(defaultdict(float), days, cats, amounts, (target, target)))
+
+    def cached_series(
+        self,
+        granularity: str,
+        year: int,
+        month: Optional[int] = None,
+        day: Optional[int] = None,
+        week: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """
+        REQUIRES: active session; parameters match the granularity
+                  (DAILY: month+day, WEEKLY: month+week, MONTHLY: month, YEARLY: none)
+        MODIFIES: self (series memo)
+        EFFECTS:  Returns a copy of {category -> amount} for the chart, memoized per
+                  data version (session path + file mtime/size).
+        """
+        self._sync_cache_version()
+        key = (granularity, year, month, day, week)
+        series = self._series_cache.get(key)
+        if series is None:
+            if granularity == "DAILY":
+                series = self.get_category_totals_day(year, month, day)  # type: ignore[arg-type]
+            elif granularity == "WEEKLY":
+                series = self.get_category_totals_week(year, month, week)  # type: ignore[arg-type]
+            elif granularity == "MONTHLY":
+                series = self.get_category_totals_month(year, month)  # type: ignore[arg-type]
+            elif granularity == "YEARLY":
+                series = self.get_category_totals_year(year)
+            else:
+                raise ValidationError(f"Unknown chart granularity: {granularity}")
+            if len(self._series_cache) >= self.SERIES_CACHE_MAX_ENTRIES:
+                self._series_cache.clear()
+            self._series_cache[key] = series
+        return dict(series)
 
     def get_income_vs_expense_year(self) -> Dict[str, float]:
         """
         REQUIRES: active session
         EFFECTS:  Returns {'income': total_income, 'expense': total_expense, 'net': net}.
         """
+        _, (income, expense) = self._aggregate_all()
+        return {"income": income, "expense": expense, "net": income - expense}
+
+    # ------------ Internals ------------
+
+    def _iter_all_transactions(self) -> Iterable[Transaction]:
+        """
+        REQUIRES: active session
+        EFFECTS:  Yields every Transaction in the workbook (skips Nones/invalid),
+                  served from the per-version month memo.
+        """
+        if not self._load_all_months():
+            return  # empty generator
+        for month_key in MONTHS_IN_ORDER:
+            yield from self._month_cache[month_key]
+
+    def _iter_month_transactions(self, month_key: str) -> Iterable[Transaction]:
+        """
+        REQUIRES: active session; valid month_key
+        EFFECTS:  Yields Transactions for a given month (skips Nones/invalid), sliced
+                  from the whole-year memo; only that month's rows are read if the
+                  workbook fails the template check. Memoized per data version.
+        """
+        self._sync_cache_version()
+        cached = self._month_cache.get(month_key)
+        if cached is None and self._load_all_months():
+            cached = self._month_cache.get(month_key)
+        if cached is None:
+            path = self.require_active_session()
+            loader = ExcelLoader()
+            loader.open(path, read_only=True)
+            # Validate by attempting read; ExcelLoader validates month name internally
+            month_data = loader.read_month(month_key)
+            loader.close()
+
+            # Loader transactions carry a normalized type already.
+            cached = [
+                tx for slots in month_data.values() for tx in slots
+                if tx is not None and tx.type in _ALLOWED_TYPES
+            ]
+            self._month_cache[month_key] = cached
+
+        yield from cached
+
+    def _aggregate_all(self) -> YearRollup:
+        """
+        REQUIRES: active session
+        MODIFIES: self (rollup memo)
+        EFFECTS:  Returns per-month and whole-year (income, expense) from a single pass
+                  over the year, memoized per data version. Month totals fall back to
+                  per-month reads and the year totals are zero if the template check
+                  fails (matching get_month_totals / _iter_all_transactions).
+        """
+        self._sync_cache_version()
+        if self._rollup is None:
+            complete = self._load_all_months()
+            by_month: Dict[str, Tuple[float, float]] = {}
+            year_income = 0.0
+            year_expense = 0.0
+            for m in MONTHS_IN_ORDER:
+                income = 0.0
+                expense = 0.0
+                for t in self._iter_month_transactions(m):
+                    ttype = t.type
+                    if ttype == "INCOME":
+                        income += t.amount
+                        year_income += t.amount
+                    elif ttype == "EXPENSE":
+                        expense += t.amount
+                        year_expense += t.amount
+                by_month[m] = (income, expense)
+            self._rollup = (by_month, (year_income, year_expense) if complete else (0.0, 0.0))
+        return self._rollup
+
+    def _income_expense(self, txs: Iterable[Transaction]) -> Tuple[float, float]:
+        """
+        REQUIRES: txs yields loader-normalized Transactions (type already upper/stripped)
+        EFFECTS:  Returns (total INCOME, total EXPENSE) in a single pass.
+        """
         income = 0.0
         expense = 0.0
-        for t in self._iter_all_transactions():
-            ttype = t.type.strip().upper()
+        for t in txs:
+            ttype = t.type
             if ttype == "INCOME":
                 income += t.amount
             elif ttype == "EXPENSE":
                 expense += t.amount
-        return {"income": income, "expense": expense, "net": income - expense}
+        return income, expense
 
-    # ------------ Internals ------------
+    def _bucket_income_expense(
+        self, keyed: Iterable[Tuple[str, Transaction]]
+    ) -> Dict[str, List[float]]:
+        """
+        REQUIRES: keyed yields (bucket label, loader-normalized Transaction)
+        EFFECTS:  Returns {label -> [income, expense]} in first-seen label order, in one pass.
+        """
+        buckets: DefaultDict[str, List[float]] = defaultdict(lambda: [0.0, 0.0])
+        for label, t in keyed:
+            totals = buckets[label]
+            ttype = t.type
+            if ttype == "INCOME":
+                totals[0] += t.amount
+            elif ttype == "EXPENSE":
+                totals[1] += t.amount
+        return dict(buckets)
 
-    def _iter_all_transactions(self) -> Iterable[Transaction]:
+    def _series_columns(self, labels: Iterable[str], totals: Dict[str, Sequence[float]]) -> SeriesColumns:
         """
-        REQUIRES: active session
-        EFFECTS:  Yields every Transaction in the workbook (skips Nones/invalid).
+        REQUIRES: every label is a key of totals; totals values are (income, expense)
+        EFFECTS:  Returns SeriesColumns for labels, in the given order.
+        """
+        labels = list(labels)
+        income: List[float] = []
+        expense: List[float] = []
+        net: List[float] = []
+        for label in labels:
+            inc, exp = totals[label]
+            income.append(inc)
+            expense.append(exp)
+            net.append(inc - exp)
+        return SeriesColumns(labels, income, expense, net)
+
+    def _series_rows(self, label_key: str, columns: SeriesColumns) -> List[Dict[str, float]]:
+        """
+        EFFECTS: Returns columns as one dict per row, keyed by label_key/'income'/'expense'/'net'.
         """
+        return [
+            {label_key: label, "income": inc, "expense": exp, "net": net}
+            for label, inc, exp, net in zip(*columns)
+        ]
+
+    def _load_all_months(self) -> bool:
+        """
+        REQUIRES: active session
+        MODIFIES: self (month memo)
+        EFFECTS:  Fills the month memo for every month from one read_all() if any
+                  month is missing. Returns False if the workbook fails the template check,
+                  which runs at most once per data version.
+        """
+        self._sync_cache_version()
+        if self._template_ok is False:
+            return False
+        if all(m in self._month_cache for m in MONTHS_IN_ORDER):
+            return True
         path = self.require_active_session()
-        loader = ExcelLoader()
-        loader.open(path)
-        if not loader.verify_template():
+        loader = ExcelLoader(use_sidecar=True)
+        loader.open(path, read_only=True)
+        if self._template_ok is None:
+            self._template_ok = loader.verify_template()
+        if not self._template_ok:
             loader.close()
-            return  # empty generator
+            return False
         all_data = loader.read_all()
         loader.close()
 
-        for _, days in all_data.items():
-            for _, slots in days.items():
-                for tx in slots:
-                    if tx is None:
-                        continue
-                    ttype = (tx.type or "").strip().upper()
-                    if ttype not in {"EXPENSE", "INCOME"}:
-                        continue
-                    yield tx
+        for month_key, days in all_data.items():
+            self._month_cache[month_key] = [
+                tx for slots in days.values() for tx in slots
+                if tx is not None and tx.type in _ALLOWED_TYPES
+            ]
+        return True
 
-    def _iter_month_transactions(self, month_key: str) -> Iterable[Transaction]:
+    def _month_expenses(self, month_key: str) -> ExpenseColumns:
         """
         REQUIRES: active session; valid month_key
-        EFFECTS:  Yields Transactions for a given month (skips Nones/invalid).
+        MODIFIES: self (expense memo)
+        EFFECTS:  Returns the month's EXPENSE rows as parallel (days, categories, amounts)
+                  columns (blank category -> MISCELLANEOUS), memoized per data version.
+        """
+        self._sync_cache_version()
+        columns = self._expense_cache.get(month_key)
+        if columns is None:
+            days: List[int] = []
+            cats: List[str] = []
+            amounts: List[float] = []
+            for t in self._iter_month_transactions(month_key):
+                if t.type != "EXPENSE":
+                    continue
+                days.append(t.get_day())
+                cats.append(t.category or "MISCELLANEOUS")
+                amounts.append(t.amount)
+            columns = (days, cats, amounts)
+            self._expense_cache[month_key] = columns
+        return columns
+
+    def _sum_by_category(
+        self,
+        totals: DefaultDict[str, float],
+        days: List[int],
+        cats: List[str],
+        amounts: List[float],
+        day_range: Optional[Tuple[int, int]] = None,
+    ) -> DefaultDict[str, float]:
+        """
+        REQUIRES: days/cats/amounts are parallel columns (see _month_expenses)
+        MODIFIES: totals
+        EFFECTS:  Adds each amount (whose day lies in the inclusive day_range, if given)
+                  into totals[category]; returns totals.
+        """
+        if day_range is None:
+            for cat, amount in zip(cats, amounts):
+                totals[cat] += amount
+        else:
+            lo, hi = day_range
+            for d, cat, amount in zip(days, cats, amounts):
+                if lo <= d <= hi:
+                    totals[cat] += amount
+        return totals
+
+    def _month_key(self, month: int) -> str:
+        """
+        REQUIRES: 1 <= month <= 12
+        EFFECTS:  Returns the template month key (e.g., 3 -> 'MARCH').
+        """
+        m = int(month)
+        if m < 1 or m > 12:
+            raise ValidationError("Month must be between 1 and 12.")
+        return MONTHS_IN_ORDER[m - 1]
+
+    def _data_version(self) -> Tuple:
+        """
+        REQUIRES: active session
+        EFFECTS:  Returns (session_path, st_mtime_ns, st_size); changes whenever the file is rewritten.
         """
         path = self.require_active_session()
-        loader = ExcelLoader()
-        loader.open(path)
-        # Validate by attempting read; ExcelLoader validates month name internally
-        month_data = loader.read_month(month_key)
-        loader.close()
+        try:
+            st = Path(path).stat()
+        except OSError:
+            return (path, None, None)
+        return (path, st.st_mtime_ns, st.st_size)
 
-        for _, slots in month_data.items():
-            for tx in slots:
-                if tx is None:
-                    continue
-                ttype = (tx.type or "").strip().upper()
-                if ttype not in {"EXPENSE", "INCOME"}:
-                    continue
-                yield tx
+    def _sync_cache_version(self) -> None:
+        """
+        REQUIRES: active session
+        MODIFIES: self
+        EFFECTS:  Clears the memos if the session file changed since they were filled.
+        """
+        version = self._data_version()
+        if version != self._cache_version:
+            self._clear_memos()
+            self._cache_version = version
+
+    def _clear_memos(self) -> None:
+        """
+        MODIFIES: self
+        EFFECTS:  Drops every per-version memo.
+        """
+        self._year = None
+        self._template_ok = None
+        self._series_cache.clear()
+        self._month_cache.clear()
+        self._expense_cache.clear()
+        self._rollup = None
 
     def _safe_date_key(self, datestr: str) -> Tuple[int, int, int]:
         """
@@ -258,4 +572,4 @@ class AnalyticManager:
         REQUIRES: datestr is 'YYYY-MM-DD'
         EFFECTS:  Returns a date object; raises on failure.
         """
-        return datetime.strptime(str(datestr), "%Y-%m-%d").date()
+        return _parse_date(str(datestr))
@@ -6,22 +6,13 @@ from pathlib import Path
 from typing import Optional, Any
 
 from PyQt5.QtCore import QObject
+# Not deferred: a ScreenManager only exists once QApplication has loaded QtWidgets.
 from PyQt5.QtWidgets import QMessageBox, QWidget
 
 from managers.analytic_manager import AnalyticManager
 from managers.session_manager import SessionManager
 from notifications.concrete.budget_update_publisher import BudgetUpdatePublisher
 
-try:
-    from ui.screens.welcome_screen import WelcomeScreen
-except Exception:
-    WelcomeScreen = None  # type: ignore
-
-try:
-    from ui.screens.main_window import MainWindow
-except Exception:
-    MainWindow = None  # type: ignore
-
 
 class ScreenManager(QObject):
     """
@@ -41,12 +32,19 @@ class ScreenManager(QObject):
         self._publisher: BudgetUpdatePublisher = BudgetUpdatePublisher()
         self._analytics: AnalyticManager = AnalyticManager(session_path=None)
 
+        # Screen classes resolved lazily by the import_*_safe helpers
+        self._welcome_screen_cls: Optional[type[Any]] = None
+        self._main_window_cls: Optional[type[Any]] = None
+        self._download_screen_cls: Optional[type[Any]] = None
+        self._transaction_scene_cls: Optional[type[Any]] = None
+
     def show_welcome(self) -> None:
         """
         REQUIRES: none
         MODIFIES: window stack
         EFFECTS:  Shows Welcome and closes Main/Download/Transaction.
         """
+        WelcomeScreen = self.import_welcome_screen_safe()
         if WelcomeScreen is None:
             QMessageBox.critical(None, "Missing Screen", "WelcomeScreen is not available.")
             return
@@ -92,6 +90,7 @@ class ScreenManager(QObject):
         MODIFIES: window stack; analytics session path
         EFFECTS:  Creates Main with session_path set before showing and points analytics at it.
         """
+        MainWindow = self.import_main_window_safe()
         if MainWindow is None:
             QMessageBox.critical(None, "Missing Screen", "MainWindow is not available.")
             return
@@ -218,27 +217,57 @@ class ScreenManager(QObject):
             QMessageBox.warning(None, "Backup Error", str(e))
             return None
 
+    def import_welcome_screen_safe(self):
+        """
+        REQUIRES: none
+        EFFECTS:  Returns WelcomeScreen class if importable, else None (cached once found).
+        """
+        if self._welcome_screen_cls is None:
+            try:
+                from ui.screens.welcome_screen import WelcomeScreen  # type: ignore
+                self._welcome_screen_cls = WelcomeScreen
+            except Exception:
+                return None
+        return self._welcome_screen_cls
+
+    def import_main_window_safe(self):
+        """
+        REQUIRES: none
+        EFFECTS:  Returns MainWindow class if importable, else None (cached once found).
+        """
+        if self._main_window_cls is None:
+            try:
+                from ui.screens.main_window import MainWindow  # type: ignore
+                self._main_window_cls = MainWindow
+            except Exception:
+                return None
+        return self._main_window_cls
+
     def import_download_screen_safe(self):
         """
         REQUIRES: none
-        EFFECTS:  Returns DownloadScreen class if importable, else None.
+        EFFECTS:  Returns DownloadScreen class if importable, else None (cached once found).
         """
-        try:
-            from ui.screens.download_screen import DownloadScreen  # type: ignore
-            return DownloadScreen
-        except Exception:
-            return None
+        if self._download_screen_cls is None:
+            try:
+                from ui.screens.download_screen import DownloadScreen  # type: ignore
+                self._download_screen_cls = DownloadScreen
+            except Exception:
+                return None
+        return self._download_screen_cls
 
     def import_transaction_scene_safe(self):
         """
         REQUIRES: none
-        EFFECTS:  Returns TransactionScene class if importable, else None.
+        EFFECTS:  Returns TransactionScene class if importable, else None (cached once found).
         """
-        try:
-            from ui.screens.transaction_scene import TransactionScene  # type: ignore
-            return TransactionScene
-        except Exception:
-            return None
+        if self._transaction_scene_cls is None:
+            try:
+                from ui.screens.transaction_scene import TransactionScene  # type: ignore
+                self._transaction_scene_cls = TransactionScene
+            except Exception:
+                return None
+        return self._transaction_scene_cls
 
     def get_publisher(self) -> BudgetUpdatePublisher:
         """
@@ -6,10 +6,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import os
 import shutil
 import re
+import threading
 
 from file_io.excel_loader import ExcelLoader
 from models.transaction import Transaction
@@ -43,6 +45,9 @@ class SessionManager:
     USER_DATA_FILE = "user_data.xlsx"
     BACKUPS_DIR = "backups"
 
+    # "<prefix>_<n>.xlsx" -> (prefix, n); prefixes are compared case-insensitively
+    BACKUP_NAME_PATTERN = re.compile(r"(.+)_(\d+)\.xlsx$", re.IGNORECASE)
+
     def __init__(self, project_root: Optional[str | Path] = None) -> None:
         # Default to repo root (…/money_manager)
         self._project_root: Path = Path(project_root) if project_root else Path(__file__).resolve().parents[1]
@@ -51,91 +56,128 @@ class SessionManager:
         self._backups_dir: Path = self._storage_dir / self.BACKUPS_DIR
         self._user_data_path: Path = self._storage_dir / self.USER_DATA_FILE
 
+        # Serializes the session-file operations below, so a caller on a worker
+        # thread cannot interleave with start/archive/write on the GUI thread.
+        self._lock = threading.RLock()
         self._state: SessionState = SessionState()
+        # (backups dir st_mtime_ns, {lowercased prefix -> highest n}) from the last scan
+        self._backup_index: Optional[Tuple[int, Dict[str, int]]] = None
+        # Writable loader kept across write_all/save; valid while the file keeps
+        # the (mtime_ns, size) stamp it had when this manager last loaded/saved it.
+        self._loader: Optional[ExcelLoader] = None
+        self._loader_stamp: Optional[Tuple[int, int]] = None
 
     # ---------------------------- Public API ----------------------------
 
     def start_fresh_session(self) -> str:
-        self.ensure_base_paths()
-        self.archive_if_stale_exists(label="Stale")
+        with self._lock:
+            self.release_loader()
+            self.ensure_base_paths()
+            self.archive_if_stale_exists(label="Stale")
 
-        loader = ExcelLoader()
-        session_path: str = loader.prepare_fresh_session(str(self._template_path), str(self._storage_dir))
-        loader.close()
+            loader = ExcelLoader()
+            session_path: str = loader.prepare_fresh_session(str(self._template_path), str(self._storage_dir))
+            loader.close()
 
-        self._state.session_path = session_path
-        self._state.mode = "FRESH"
-        return session_path
+            self._state.session_path = session_path
+            self._state.mode = "FRESH"
+            return session_path
 
     def start_imported_session(self, source_path: str) -> str:
-        self.ensure_base_paths()
-        validate_user_upload_path(source_path)
-        validate_upload_filesize(source_path)
-        validate_template_signature(source_path)
-
-        self.archive_if_stale_exists(label="Stale")
-
-        loader = ExcelLoader()
-        session_path: str = loader.prepare_fresh_session(str(self._template_path), str(self._storage_dir))
-        loader.import_into_session(source_path)
-        loader.close()
+        with self._lock:
+            self.release_loader()
+            self.ensure_base_paths()
+            validate_user_upload_path(source_path)
+            validate_upload_filesize(source_path)
+            validate_template_signature(source_path)
+
+            self.archive_if_stale_exists(label="Stale")
+
+            # Copy the upload straight into the session slot instead of copying the
+            # template and then replacing it.
+            loader = ExcelLoader()
+            session_path: str = loader.prepare_imported_session(source_path, str(self._storage_dir))
+            loader.close()
 
-        self._state.session_path = session_path
-        self._state.mode = "IMPORTED"
-        return session_path
+            self._state.session_path = session_path
+            self._state.mode = "IMPORTED"
+            return session_path
 
     def read_all(self) -> Dict[str, Dict[int, List[Optional[Transaction]]]]:
-        self.require_active_session()
-        loader = ExcelLoader()
-        loader.open(self._state.session_path)  # type: ignore[arg-type]
-        if not loader.verify_template():
+        with self._lock:
+            self.require_active_session()
+            loader = ExcelLoader(use_sidecar=True)
+            loader.open(self._state.session_path, read_only=True)  # type: ignore[arg-type]
+            if not loader.verify_template():
+                loader.close()
+                raise ValidationError("Active session file no longer matches the template signature.")
+            data = loader.read_all()
             loader.close()
-            raise ValidationError("Active session file no longer matches the template signature.")
-        data = loader.read_all()
-        loader.close()
-        return data
+            return data
 
-    def write_all(self, data: Dict[str, Dict[int, List[Optional[Transaction]]]]) -> None:
+    def write_all(
+        self,
+        data: Dict[str, Dict[int, List[Optional[Transaction]]]],
+        dirty: Optional[Iterable[Tuple[str, int, int]]] = None,
+    ) -> None:
         """
         REQUIRES: active session; data matches schema used by ExcelLoader.read_all()
         MODIFIES: session file
-        EFFECTS:  Writes the provided working set to the workbook and saves it.
+        EFFECTS:  Writes the provided working set to the workbook and saves it. Callers
+                  that know which (month, day, slot) keys they changed pass them as
+                  dirty so only those rows are rewritten.
         """
-        self.require_active_session()
-        loader = ExcelLoader()
-        loader.open(self._state.session_path)  # type: ignore[arg-type]
-        if not loader.verify_template():
-            loader.close()
-            raise ValidationError("Active session file no longer matches the template signature.")
-        loader.write_all(data)
-        loader.save()
-        loader.close()
+        with self._lock:
+            self.require_active_session()
+            loader = self.session_loader()
+            if not loader.verify_template():
+                self.release_loader()
+                raise ValidationError("Active session file no longer matches the template signature.")
+            try:
+                loader.write_all(data, dirty)
+                loader.save()
+            except Exception:
+                # Don't keep a half-written workbook around for the next call.
+                self.release_loader()
+                raise
+            self._loader_stamp = loader.file_stamp()
 
     def save(self) -> None:
-        self.require_active_session()
-        loader = ExcelLoader()
-        loader.open(self._state.session_path)  # type: ignore[arg-type]
-        loader.save()
-        loader.close()
+        """
+        REQUIRES: active session
+        MODIFIES: session file
+        EFFECTS:  Saves pending writes of the session loader. Every write path here
+                  saves immediately, so with nothing pending the file is left untouched
+                  instead of being loaded and re-serialized.
+        """
+        with self._lock:
+            self.require_active_session()
+            loader = self._loader
+            if loader is not None and loader.has_unsaved_changes():
+                loader.save()
+                self._loader_stamp = loader.file_stamp()
 
     def save_backup(self, backup_dir: str) -> str:
-        self.require_active_session()
-        validate_backup_directory(backup_dir)
-        loader = ExcelLoader()
-        loader.open(self._state.session_path)  # type: ignore[arg-type]
-        dst = loader.save_backup(backup_dir)
-        loader.close()
-        return dst
+        with self._lock:
+            self.require_active_session()
+            validate_backup_directory(backup_dir)
+            loader = ExcelLoader()
+            loader.open(self._state.session_path)  # type: ignore[arg-type]
+            dst = loader.save_backup(backup_dir)
+            loader.close()
+            return dst
 
     def end_session_and_archive(self) -> Optional[str]:
-        if not self.is_session_active():
-            return None
+        with self._lock:
+            if not self.is_session_active():
+                return None
 
-        label: str = "Fresh" if self._state.mode == "FRESH" else "Imported" if self._state.mode == "IMPORTED" else "Prev"
-        archived: str = self.archive_current_user_data(label=label)
+            self.release_loader()
+            label: str = "Fresh" if self._state.mode == "FRESH" else "Imported" if self._state.mode == "IMPORTED" else "Prev"
+            archived: str = self.archive_current_user_data(label=label)
 
-        self._state = SessionState()
-        return archived
+            self._state = SessionState()
+            return archived
 
     # -------- Small helpers exposed to UI code --------
 
@@ -154,6 +196,33 @@ class SessionManager:
         validate_fresh_session_paths(str(self._template_path), str(self._storage_dir))
         self._backups_dir.mkdir(parents=True, exist_ok=True)
 
+    def session_loader(self) -> ExcelLoader:
+        """
+        REQUIRES: active session
+        MODIFIES: self
+        EFFECTS:  Returns the long-lived writable loader for the session file, (re)opening
+                  it if none is held or the file changed on disk since it was loaded/saved.
+        """
+        path = str(Path(self._state.session_path).resolve())  # type: ignore[arg-type]
+        loader = self._loader
+        if loader is None or loader.get_path() != path or loader.file_stamp() != self._loader_stamp:
+            self.release_loader()
+            loader = ExcelLoader()
+            loader.open(path)
+            self._loader = loader
+            self._loader_stamp = loader.file_stamp()
+        return loader
+
+    def release_loader(self) -> None:
+        """
+        MODIFIES: self
+        EFFECTS:  Drops the long-lived session loader (unsaved writes are discarded).
+        """
+        if self._loader is not None:
+            self._loader.close()
+        self._loader = None
+        self._loader_stamp = None
+
     def require_active_session(self) -> None:
         if not self.is_session_active():
             raise ValidationError("No active session. Start a fresh or imported session first.")
@@ -177,16 +246,42 @@ class SessionManager:
         return str(archived_path)
 
     def unique_backup_name(self, prefix: str) -> Path:
-        pattern = re.compile(re.escape(prefix) + r"_(\d+)\.xlsx$", re.IGNORECASE)
-        max_n: int = 0
-        for p in self._backups_dir.glob("*.xlsx"):
-            m = pattern.match(p.name)
-            if m:
-                try:
-                    n = int(m.group(1))
-                    if n > max_n:
-                        max_n = n
-                except Exception:
-                    pass
-        next_n = max_n + 1
-        return self._backups_dir / f"{prefix}_{next_n}.xlsx"
+        key = prefix.lower()
+        index = self.backup_index()
+        next_n: int = index.get(key, 0) + 1
+        candidate = self._backups_dir / f"{prefix}_{next_n}.xlsx"
+        while candidate.exists():
+            next_n += 1
+            candidate = self._backups_dir / f"{prefix}_{next_n}.xlsx"
+        # Record the number as taken: a move within the same mtime tick of a coarse
+        # filesystem would not trigger a rescan.
+        index[key] = next_n
+        return candidate
+
+    def backup_index(self) -> Dict[str, int]:
+        """
+        REQUIRES: none
+        MODIFIES: self
+        EFFECTS:  Returns {lowercased prefix -> highest n} over "<prefix>_<n>.xlsx" backups.
+                  The directory is rescanned only when its mtime changes; names handed
+                  out by unique_backup_name are recorded in the cached index directly.
+        """
+        try:
+            dir_mtime = self._backups_dir.stat().st_mtime_ns
+        except OSError:
+            return {}
+        if self._backup_index is not None and self._backup_index[0] == dir_mtime:
+            return self._backup_index[1]
+
+        index: Dict[str, int] = {}
+        match = self.BACKUP_NAME_PATTERN.match
+        with os.scandir(self._backups_dir) as entries:
+            for entry in entries:
+                m = match(entry.name)
+                if m:
+                    key = m.group(1).lower()
+                    n = int(m.group(2))
+                    if n > index.get(key, 0):
+                        index[key] = n
+        self._backup_index = (dir_mtime, index)
+        return index
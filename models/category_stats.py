@@ -2,16 +2,21 @@
 #
 # CategoryStats groups transactions by category.
 
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from models.transaction import Transaction
 
 """
 Abstraction Function:
-- Maintains category → List[Transaction] for supported categories.
+- Maintains category → List[Transaction] for supported categories, where
+  category ALL_CATEGORIES[i] is stored at _categories[i].
 - Expense categories + two special buckets (INCOME, NONE).
+- _views[i], when not None, is a tuple snapshot of _categories[i].
 
 Representation Invariant:
-- _categories contains every supported key.
+- _categories and _views have len(ALL_CATEGORIES) entries.
+- _views[i] is None or _views[i] == tuple(_categories[i]).
 - Unknown categories are routed to MISCELLANEOUS.
 """
 
@@ -36,6 +41,32 @@ SPECIAL_CATEGORIES: List[str] = [
 
 ALL_CATEGORIES: List[str] = EXPENSE_CATEGORIES + SPECIAL_CATEGORIES
 
+# Category → position in ALL_CATEGORIES
+CATEGORY_INDEX: Dict[str, int] = {c: i for i, c in enumerate(ALL_CATEGORIES)}
+
+_MISC_INDEX: int = CATEGORY_INDEX["MISCELLANEOUS"]
+
+
+@lru_cache(maxsize=128)
+def _normalize_category(category: str) -> int:
+    """
+    REQUIRES: category is a string
+    EFFECTS:  Returns the bucket index for category (unknown → MISCELLANEOUS).
+    """
+    return CATEGORY_INDEX.get(category.strip().upper(), _MISC_INDEX)
+
+
+def _category_index(category: Optional[str]) -> int:
+    """
+    REQUIRES: category is a string or None
+    EFFECTS:  Returns the bucket index for category; canonical names cost one dict
+              lookup (unknown → MISCELLANEOUS).
+    """
+    idx = CATEGORY_INDEX.get(category)  # type: ignore[arg-type]
+    if idx is not None:
+        return idx
+    return _normalize_category(category or "")
+
 
 class CategoryStats:
     """
@@ -43,13 +74,16 @@ class CategoryStats:
     No analytics or file I/O here—just list management.
     """
 
+    __slots__ = ("_categories", "_views")
+
     def __init__(self) -> None:
         """
         REQUIRES: nothing
         MODIFIES: self
         EFFECTS: Initializes empty lists for every supported category.
         """
-        self._categories: Dict[str, List[Transaction]] = {c: [] for c in ALL_CATEGORIES}
+        self._categories: List[List[Transaction]] = [[] for _ in ALL_CATEGORIES]
+        self._views: List[Optional[Tuple[Transaction, ...]]] = [None] * len(ALL_CATEGORIES)
 
     # ----------------------------- Add / Get / Set -----------------------------
 
@@ -59,10 +93,9 @@ class CategoryStats:
         MODIFIES: self
         EFFECTS:  Appends to category (unknown → MISCELLANEOUS).
         """
-        key: str = (category or "").strip().upper()
-        if key not in self._categories:
-            key = "MISCELLANEOUS"
-        self._categories[key].append(transaction)
+        idx: int = _category_index(category)
+        self._categories[idx].append(transaction)
+        self._views[idx] = None
 
     def get_transactions(self, category: str) -> List[Transaction]:
         """
@@ -71,10 +104,8 @@ class CategoryStats:
         EFFECTS:  Returns a shallow copy of the list for the category
                   (unknown → MISCELLANEOUS).
         """
-        key: str = (category or "").strip().upper()
-        if key not in self._categories:
-            key = "MISCELLANEOUS"
-        return list(self._categories[key])
+        idx: int = _category_index(category)
+        return list(self._categories[idx])
 
     def set_transactions(self, category: str, transactions: List[Transaction]) -> None:
         """
@@ -82,10 +113,9 @@ class CategoryStats:
         MODIFIES: self
         EFFECTS:  Replaces the list for the category (unknown → MISCELLANEOUS).
         """
-        key: str = (category or "").strip().upper()
-        if key not in self._categories:
-            key = "MISCELLANEOUS"
-        self._categories[key] = list(transactions)
+        idx: int = _category_index(category)
+        self._categories[idx] = list(transactions)
+        self._views[idx] = None
 
     # ----------------------------- Bulk Accessors -----------------------------
 
@@ -95,7 +125,33 @@ class CategoryStats:
         MODIFIES: nothing
         EFFECTS:  Returns a shallow copy of category → transactions mapping.
         """
-        return {k: list(v) for k, v in self._categories.items()}
+        return {k: list(v) for k, v in zip(ALL_CATEGORIES, self._categories)}
+
+    def get_all_categories_view(self) -> Mapping[str, Tuple[Transaction, ...]]:
+        """
+        REQUIRES: nothing
+        MODIFIES: self (tuple snapshots)
+        EFFECTS:  Returns a read-only category → transactions mapping. Each category's
+                  tuple is built once and reused until that category changes.
+        """
+        views = self._views
+        for i, v in enumerate(self._categories):
+            if views[i] is None:
+                views[i] = tuple(v)
+        return MappingProxyType(dict(zip(ALL_CATEGORIES, views)))  # type: ignore[arg-type]
+
+    def get_category_totals(self) -> Dict[str, Tuple[float, int]]:
+        """
+        REQUIRES: nothing
+        MODIFIES: nothing
+        EFFECTS:  Returns category → (sum of amounts, transaction count) for every
+                  supported category. Amounts are read from the stored transactions,
+                  so later set_amount() calls are reflected.
+        """
+        return {
+            k: (sum([t.amount for t in v], 0.0), len(v))
+            for k, v in zip(ALL_CATEGORIES, self._categories)
+        }
 
     # ----------------------------- Clear Helpers -----------------------------
 
@@ -105,16 +161,16 @@ class CategoryStats:
         MODIFIES: self
         EFFECTS:  Empties the list for the category (unknown → MISCELLANEOUS).
         """
-        key: str = (category or "").strip().upper()
-        if key not in self._categories:
-            key = "MISCELLANEOUS"
-        self._categories[key].clear()
+        idx: int = _category_index(category)
+        self._categories[idx].clear()
+        self._views[idx] = None
 
     def clear_all(self) -> None:
         """
         REQUIRES: nothing
         MODIFIES: self
-        EFFECTS:  Empties every category list.
+        EFFECTS:  Empties every category list. Fresh containers are safe here because
+                  no accessor hands out the internal lists.
         """
-        for key in self._categories:
-            self._categories[key].clear()
+        self._categories = [[] for _ in ALL_CATEGORIES]
+        self._views = [None] * len(ALL_CATEGORIES)
@@ -1,7 +1,10 @@
 # File: models/transaction.py
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
 
 """
 Represents a single financial entry read/written to the workbook.
@@ -20,8 +23,30 @@ Representation Invariant:
 """
 
 
+# Canonical type strings, so every Transaction shares the same two objects.
+_TYPE_INTERN = {"INCOME": "INCOME", "EXPENSE": "EXPENSE"}
+
+
+@lru_cache(maxsize=1024)
+def _split_date(date: str) -> Tuple[str, ...]:
+    """EFFECTS: Returns date.split("-") as a tuple (memoized; a year has few distinct dates)."""
+    return tuple(date.split("-"))
+
+
+@lru_cache(maxsize=1024)
+def _day_of(date: str) -> int:
+    """EFFECTS: Returns the DD field of date as int, or 0 if missing/invalid (memoized)."""
+    try:
+        return int(_split_date(date)[2])
+    except Exception:
+        return 0
+
+
 @dataclass
 class Transaction:
+    # Fixed field set: no per-instance __dict__ (one Transaction per workbook row)
+    __slots__ = ("date", "day", "category", "amount", "type", "description")
+
     # Canonical shape (explicit types, Java-style clarity)
     date: str
     day: str
@@ -35,17 +60,37 @@ class Transaction:
         REQUIRES: fields may be loosely formatted from I/O
         MODIFIES: self
         EFFECTS:  Normalizes strings, uppercases category/type, and coerces amount to float.
+                  Category and type strings are interned (both come from small sets).
         """
         self.date = (self.date or "").strip()
         self.day = (self.day or "").strip()
-        self.category = (self.category or "").strip().upper()
+        self.category = sys.intern((self.category or "").strip().upper())
         self.description = (self.description or "").strip()
-        self.type = (self.type or "").strip().upper()
+        t = (self.type or "").strip().upper()
+        self.type = _TYPE_INTERN.get(t, t)
         try:
             self.amount = float(self.amount)
         except (TypeError, ValueError):
             self.amount = 0.0
 
+    @classmethod
+    def from_normalized(
+        cls, date: str, day: str, category: str, amount: float, type: str, description: str
+    ) -> Transaction:
+        """
+        REQUIRES: values are already in the form __post_init__ produces (stripped
+                  strings, UPPERCASE category/type, float amount)
+        EFFECTS:  Returns a Transaction built without re-running the normalization.
+        """
+        tx = cls.__new__(cls)
+        tx.date = date
+        tx.day = day
+        tx.category = category
+        tx.amount = amount
+        tx.type = type
+        tx.description = description
+        return tx
+
     # ------------------------------------------------------------------
     # Legacy compatibility layer (kept to avoid breaking older callers)
     # ------------------------------------------------------------------
@@ -70,19 +115,16 @@ class Transaction:
     # The old model exposed year/month/day separately; we map them from date.
     def get_year(self) -> str:
         """EFFECTS: Returns YYYY (string) if available, else ""."""
-        return self.date.split("-")[0] if self.date and "-" in self.date else ""
+        return _split_date(self.date)[0] if self.date and "-" in self.date else ""
 
     def get_month(self) -> str:
         """EFFECTS: Returns MM (string, zero-padded) if available, else ""."""
-        parts = self.date.split("-")
+        parts = _split_date(self.date)
         return parts[1] if len(parts) >= 2 else ""
 
     def get_day(self) -> int:
         """EFFECTS: Returns DD (int) if available, else 0."""
-        try:
-            return int(self.date.split("-")[2])
-        except Exception:
-            return 0
+        return _day_of(self.date)
 
     # ----- SETTERS (legacy names) -----
     def set_amount(self, new_amount: float) -> None:
@@ -100,17 +142,18 @@ class Transaction:
         """
         REQUIRES: new_category may be any string
         MODIFIES: self
-        EFFECTS:  Sets category (uppercased, trimmed).
+        EFFECTS:  Sets category (uppercased, trimmed, interned).
         """
-        self.category = (new_category or "").strip().upper()
+        self.category = sys.intern((new_category or "").strip().upper())
 
     def set_type(self, new_type: str) -> None:
         """
         REQUIRES: new_type ∈ {"INCOME","EXPENSE"} (validated elsewhere)
         MODIFIES: self
-        EFFECTS:  Sets type (uppercased, trimmed).
+        EFFECTS:  Sets type (uppercased, trimmed, interned).
         """
-        self.type = (new_type or "").strip().upper()
+        t = (new_type or "").strip().upper()
+        self.type = _TYPE_INTERN.get(t, t)
 
     def set_description(self, new_description: str) -> None:
         """
@@ -127,7 +170,7 @@ class Transaction:
         EFFECTS:  Rewrites date preserving MM-DD if present.
         """
         yy: str = (new_year or "").strip()
-        parts = (self.date or "").split("-")
+        parts = _split_date(self.date or "")
         mm: str = parts[1] if len(parts) >= 2 else "01"
         dd: str = parts[2] if len(parts) >= 3 else "01"
         if yy:
@@ -145,7 +188,7 @@ class Transaction:
         except Exception:
             mm_i = 1
         mm: str = f"{mm_i:02d}"
-        parts = (self.date or "").split("-")
+        parts = _split_date(self.date or "")
         yy: str = parts[0] if len(parts) >= 1 and parts[0] else "0000"
         dd: str = parts[2] if len(parts) >= 3 else "01"
         self.date = f"{yy}-{mm}-{dd}"
@@ -161,7 +204,7 @@ class Transaction:
         except Exception:
             dd_i = 1
         dd: str = f"{dd_i:02d}"
-        parts = (self.date or "").split("-")
+        parts = _split_date(self.date or "")
         yy: str = parts[0] if len(parts) >= 1 and parts[0] else "0000"
         mm: str = parts[1] if len(parts) >= 2 else "01"
         self.date = f"{yy}-{mm}-{dd}"
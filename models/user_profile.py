@@ -1,6 +1,7 @@
 # File: models/user_profile.py
 
-from typing import Dict, List
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional
 from models.transaction import Transaction
 
 """
@@ -8,14 +9,19 @@ Represents a user's financial profile (income + day-based transactions).
 
 Abstraction Function:
 - Stores current income and a mapping of date → list of Transaction.
+- _date_index, when built, is the sorted list of _transactions' date keys.
 
 Representation Invariant:
 - _current_income >= 0
 - _transactions: Dict["YYYY-MM-DD", List[Transaction]]
+- _date_index is None or sorted(_transactions); add_transaction/remove_transaction
+  keep it in step, set_transactions drops it
 """
 
 
 class UserProfile:
+    __slots__ = ("_current_income", "_transactions", "_date_index")
+
     def __init__(self, current_income: float = 0.0):
         """
         REQUIRES: current_income >= 0
@@ -24,6 +30,7 @@ class UserProfile:
         """
         self._current_income: float = current_income
         self._transactions: Dict[str, List[Transaction]] = {}  # Key: "YYYY-MM-DD"
+        self._date_index: Optional[List[str]] = None
 
     # ---------------- Income ----------------
 
@@ -49,7 +56,9 @@ class UserProfile:
         """
         REQUIRES: nothing
         MODIFIES: nothing
-        EFFECTS:  Returns the internal transaction dictionary.
+        EFFECTS:  Returns the internal transaction dictionary. Add or remove dates
+                  through add_transaction/remove_transaction so the date index
+                  stays current.
         """
         return self._transactions
 
@@ -60,3 +69,54 @@ class UserProfile:
         EFFECTS:  Replaces the internal transaction dictionary.
         """
         self._transactions = transactions
+        self._date_index = None
+
+    def add_transaction(self, tx: Transaction) -> None:
+        """
+        REQUIRES: tx.date is "YYYY-MM-DD"
+        MODIFIES: self
+        EFFECTS:  Appends tx under its date, inserting the date into the index if new.
+        """
+        slot = self._transactions.get(tx.date)
+        if slot is None:
+            self._transactions[tx.date] = [tx]
+            if self._date_index is not None:
+                insort(self._date_index, tx.date)
+        else:
+            slot.append(tx)
+
+    def remove_transaction(self, tx: Transaction) -> bool:
+        """
+        REQUIRES: nothing
+        MODIFIES: self
+        EFFECTS:  Removes tx from its date (dropping the date once empty); returns
+                  False if tx was not stored.
+        """
+        slot = self._transactions.get(tx.date)
+        if slot is None or tx not in slot:
+            return False
+        slot.remove(tx)
+        if not slot:
+            del self._transactions[tx.date]
+            if self._date_index is not None:
+                keys = self._date_index
+                del keys[bisect_left(keys, tx.date)]
+        return True
+
+    def transactions_between(self, start_date: str, end_date: str) -> List[Transaction]:
+        """
+        REQUIRES: start_date and end_date are "YYYY-MM-DD"
+        MODIFIES: self (date index)
+        EFFECTS:  Returns transactions dated start_date..end_date inclusive, in date
+                  order. ISO date keys sort chronologically, so the range is found by
+                  binary search over the sorted key index (rebuilt if the key count
+                  shows the dict was changed directly).
+        """
+        transactions = self._transactions
+        keys = self._date_index
+        if keys is None or len(keys) != len(transactions):
+            keys = self._date_index = sorted(transactions)
+        result: List[Transaction] = []
+        for key in keys[bisect_left(keys, start_date):bisect_right(keys, end_date)]:
+            result.extend(transactions[key])
+        return result
@@ -2,29 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, List, Mapping, Optional
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
 
 from notifications.base.update_listener import UpdateListener
 
+# Shared read-only payload for events sent without one.
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
 
 class DataUpdatePublisher:
     """
     REQUIRES: none
     MODIFIES: _listeners
-    EFFECTS:  Maintains a list of listeners and notifies them of events.
+    EFFECTS:  Maintains an ordered set of listeners and notifies them of events.
     """
 
     def __init__(self) -> None:
-        self._listeners: List[UpdateListener] = []
+        # Listeners in attach order -> subscribed events (None = every event).
+        self._listeners: Dict[UpdateListener, Optional[FrozenSet[str]]] = {}
+        # event -> listeners to notify, derived from _listeners; cleared on attach/detach.
+        self._dispatch: Dict[str, Tuple[UpdateListener, ...]] = {}
 
-    def attach(self, listener: UpdateListener) -> None:
+    def attach(self, listener: UpdateListener, events: Optional[AbstractSet[str]] = None) -> None:
         """
         REQUIRES: listener is a concrete UpdateListener
         MODIFIES: _listeners
-        EFFECTS:  Registers the listener if not already attached.
+        EFFECTS:  Registers the listener if not already attached. If events is given,
+                  the listener is only notified of those event keys.
         """
         if listener not in self._listeners:
-            self._listeners.append(listener)
+            self._listeners[listener] = frozenset(events) if events is not None else None
+            self._dispatch.clear()
 
     def detach(self, listener: UpdateListener) -> None:
         """
@@ -32,10 +41,9 @@ class DataUpdatePublisher:
         MODIFIES: _listeners
         EFFECTS:  Unregisters the listener.
         """
-        try:
-            self._listeners.remove(listener)
-        except ValueError:
-            pass
+        if listener in self._listeners:
+            del self._listeners[listener]
+            self._dispatch.clear()
 
     def listeners(self) -> Iterable[UpdateListener]:
         """
@@ -44,15 +52,32 @@ class DataUpdatePublisher:
         """
         return iter(self._listeners)
 
+    def subscribers(self, event: str) -> Tuple[UpdateListener, ...]:
+        """
+        REQUIRES: none
+        MODIFIES: _dispatch
+        EFFECTS:  Returns the listeners subscribed to event, in attach order
+                  (memoized until the next attach/detach).
+        """
+        targets = self._dispatch.get(event)
+        if targets is None:
+            targets = tuple(
+                l for l, events in self._listeners.items()
+                if events is None or event in events
+            )
+            self._dispatch[event] = targets
+        return targets
+
     def notify(self, event: str, payload: Optional[Mapping[str, Any]] = None) -> None:
         """
         REQUIRES: event is a short event key; payload optional
         MODIFIES: each listener via UpdateListener.update()
-        EFFECTS:  Broadcasts the event to all listeners.
+        EFFECTS:  Broadcasts the event to every listener subscribed to it.
         """
-        for l in list(self._listeners):
+        data = payload if payload is not None else _EMPTY_PAYLOAD
+        for l in self.subscribers(event):
             try:
-                l.update(event, payload or {})
+                l.update(event, data)
             except Exception:
                 # Fail-safe: a misbehaving listener should not break the publisher.
                 continue
@@ -12,6 +12,8 @@ class BudgetUpdatePublisher(DataUpdatePublisher):
     REQUIRES: none
     MODIFIES: observers via notify()
     EFFECTS:  Specialized publisher for session and budget-related events.
+              emit_* methods return before building a payload if no listener
+              is subscribed to the event.
     """
 
     EVENT_SESSION_SAVED = "session:saved"
@@ -25,6 +27,8 @@ class BudgetUpdatePublisher(DataUpdatePublisher):
         MODIFIES: observers
         EFFECTS:  Notifies that the session file has been flushed to disk.
         """
+        if not self.subscribers(self.EVENT_SESSION_SAVED):
+            return
         self.notify(self.EVENT_SESSION_SAVED, {"path": path})
 
     def emit_transactions_changed(self, count: int | None = None) -> None:
@@ -33,6 +37,8 @@ class BudgetUpdatePublisher(DataUpdatePublisher):
         MODIFIES: observers
         EFFECTS:  Notifies that queued transactions were written.
         """
+        if not self.subscribers(self.EVENT_TRANSACTIONS_CHANGED):
+            return
         payload: Mapping[str, Any] = {"count": count} if count is not None else {}
         self.notify(self.EVENT_TRANSACTIONS_CHANGED, payload)
 
@@ -42,6 +48,8 @@ class BudgetUpdatePublisher(DataUpdatePublisher):
         MODIFIES: observers
         EFFECTS:  Notifies that the current income value changed.
         """
+        if not self.subscribers(self.EVENT_INCOME_CHANGED):
+            return
         self.notify(self.EVENT_INCOME_CHANGED, {"income": float(new_income)})
 
     def emit_year_changed(self, new_year: int) -> None:
@@ -50,4 +58,6 @@ class BudgetUpdatePublisher(DataUpdatePublisher):
         MODIFIES: observers
         EFFECTS:  Notifies that the active year changed.
         """
+        if not self.subscribers(self.EVENT_YEAR_CHANGED):
+            return
         self.notify(self.EVENT_YEAR_CHANGED, {"year": int(new_year)})
@@ -13,35 +13,71 @@ class ChartUpdateListener(UpdateListener):
     """
     REQUIRES: analytic_manager provides read-only summaries; on_refresh is callable
     MODIFIES: none (except UI via on_refresh)
-    EFFECTS:  Reacts to budget/session events and triggers chart refresh.
+    EFFECTS:  Reacts to budget/session events and triggers chart refresh. With a
+              positive debounce_ms and a Qt application present, a burst of events
+              yields one refresh once the events stop for that long; otherwise each
+              event refreshes immediately.
     """
 
-    def __init__(self, analytic_manager: AnalyticManager, on_refresh: Callable[[], None]) -> None:
+    # Events that affect chart data; pass as attach(listener, events=EVENTS).
+    EVENTS = frozenset({
+        BudgetUpdatePublisher.EVENT_TRANSACTIONS_CHANGED,
+        BudgetUpdatePublisher.EVENT_SESSION_SAVED,
+        BudgetUpdatePublisher.EVENT_INCOME_CHANGED,
+        BudgetUpdatePublisher.EVENT_YEAR_CHANGED,
+    })
+
+    def __init__(
+        self,
+        analytic_manager: AnalyticManager,
+        on_refresh: Callable[[], None],
+        debounce_ms: int = 0,
+    ) -> None:
         self._analytics: AnalyticManager = analytic_manager
         self._on_refresh: Callable[[], None] = on_refresh
         self._last_event: Optional[str] = None
 
+        # Single-shot QTimer restarted by each event; None means refresh immediately.
+        self._timer: Any = None
+        if debounce_ms > 0:
+            try:
+                from PyQt5.QtCore import QCoreApplication, QTimer
+            except ImportError:
+                QTimer = None  # type: ignore[assignment]
+            # A timer without an application (scripts, tests) would never fire.
+            if QTimer is not None and QCoreApplication.instance() is not None:
+                self._timer = QTimer()
+                self._timer.setSingleShot(True)
+                self._timer.setInterval(debounce_ms)
+                self._timer.timeout.connect(self.fire_refresh)
+
     def update(self, event: str, payload: Mapping[str, Any] | None = None) -> None:
         """
         REQUIRES: event provided by a DataUpdatePublisher
         MODIFIES: none
-        EFFECTS:  Records the event and calls on_refresh() so the UI/strategy
-                  can rebuild based on new analytics data.
+        EFFECTS:  Records the event and calls on_refresh() (now, or once the debounce
+                  window closes) so the UI/strategy can rebuild based on new analytics data.
         """
         self._last_event = event
 
         # Heuristic: only refresh when data affecting charts changed.
-        if event in {
-            BudgetUpdatePublisher.EVENT_TRANSACTIONS_CHANGED,
-            BudgetUpdatePublisher.EVENT_SESSION_SAVED,
-            BudgetUpdatePublisher.EVENT_INCOME_CHANGED,
-            BudgetUpdatePublisher.EVENT_YEAR_CHANGED,
-        }:
-            try:
-                self._on_refresh()
-            except Exception:
-                # UI callback errors should not break notification flow.
-                pass
+        if event in self.EVENTS:
+            if self._timer is not None:
+                self._timer.start()  # restarts the window if already pending
+            else:
+                self.fire_refresh()
+
+    def fire_refresh(self) -> None:
+        """
+        REQUIRES: none
+        MODIFIES: none (except UI via on_refresh)
+        EFFECTS:  Calls on_refresh(), swallowing callback errors.
+        """
+        try:
+            self._on_refresh()
+        except Exception:
+            # UI callback errors should not break notification flow.
+            pass
 
     def get_last_event(self) -> Optional[str]:
         """
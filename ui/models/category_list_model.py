@@ -0,0 +1,70 @@
+# File: ui/models/category_list_model.py
+#
+# Read-only list model behind each MainWindow category QListView.
+#
+# Abstraction Function:
+# - Row i displays _rows[i]; with no rows, a single disabled row shows _placeholder.
+#
+# Representation Invariant:
+# - _rows is a list of pre-formatted display strings.
+
+from typing import Any, List, Optional
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+
+class CategoryListModel(QAbstractListModel):
+    PLACEHOLDER: str = "— No entries yet —"
+    LOADING: str = "Loading…"
+
+    def __init__(self, parent: Optional[QObject] = None, placeholder: str = PLACEHOLDER) -> None:
+        """
+        REQUIRES: none
+        MODIFIES: self
+        EFFECTS:  Initializes an empty model showing placeholder until rows are set.
+        """
+        super().__init__(parent)
+        self._rows: List[str] = []
+        self._placeholder: str = placeholder
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """EFFECTS: Returns the number of rows (1 for the placeholder when empty)."""
+        if parent.isValid():
+            return 0
+        return len(self._rows) or 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """EFFECTS: Returns the display string for index, else None."""
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        if not self._rows:
+            return self._placeholder
+        return self._rows[index.row()]
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """EFFECTS: The placeholder row is inert; real rows are selectable."""
+        if not self._rows:
+            return Qt.NoItemFlags
+        return super().flags(index)
+
+    def set_rows(self, rows: List[str]) -> None:
+        """
+        REQUIRES: rows is a list of display strings (ownership passes to the model)
+        MODIFIES: self; attached views
+        EFFECTS:  Replaces every row with one model reset; an empty list shows PLACEHOLDER.
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._placeholder = self.PLACEHOLDER
+        self.endResetModel()
+
+    def show_placeholder(self, placeholder: str = PLACEHOLDER) -> None:
+        """
+        REQUIRES: none
+        MODIFIES: self; attached views
+        EFFECTS:  Drops every row and shows placeholder (e.g. after a failed or
+                  abandoned load leaves the model on LOADING).
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._placeholder = placeholder
+        self.endResetModel()
@@ -1,19 +1,84 @@
 # File: ui/screens/main_window.py
 
-from typing import Dict, List, Optional
-from PyQt5.QtCore import Qt
+import sys
+from typing import Dict, Iterable, List, Optional
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
-    QListWidget, QListWidgetItem, QScrollArea, QSpacerItem, QSizePolicy
+    QListView, QMessageBox, QScrollArea, QSpacerItem, QSizePolicy
 )
 
-from ui.widget_factory.concrete.button_creator import ButtonCreator
-from ui.widget_factory.concrete.label_creator import LabelCreator
+from ui.widget_factory.concrete.button_creator import BUTTON_CREATOR
+from ui.widget_factory.concrete.label_creator import LABEL_CREATOR
 from file_io.excel_loader import ExcelLoader
+from ui.models.category_list_model import CategoryListModel
 from utils.currency_formatter import format_currency
 
 
+def read_session_lines(session_path: str, categories: Iterable[str]) -> Optional[Dict[str, List[str]]]:
+    """
+    REQUIRES: categories includes "INCOME" and "MISCELLANEOUS"
+    EFFECTS:  Reads the session workbook and returns {category -> display lines};
+              None if the workbook fails the template check. Touches no widgets, so it
+              is safe to call off the GUI thread.
+    """
+    loader = ExcelLoader(use_sidecar=True)
+    loader.open(session_path, read_only=True)
+    try:
+        if not loader.verify_template():
+            return None
+        buckets: Dict[str, List[str]] = {name: [] for name in categories}
+        income = buckets["INCOME"]
+        misc = buckets["MISCELLANEOUS"]
+        fmt = format_currency
+        for tx in loader.iter_nonempty_transactions():
+            # Loader transactions are normalized: category upper-cased, type canonical.
+            lines = income if tx.type == "INCOME" else buckets.get(tx.category, misc)
+            lines.append(f"{tx.date}  •  {tx.day or '-'}  •  {fmt(tx.amount)}  •  {tx.type}  •  {tx.description or ''}")
+    finally:
+        loader.close()
+    return buckets
+
+
+class SessionLoadSignals(QObject):
+    """Signals of one SessionLoadTask; created on the GUI thread, emitted from the pool."""
+
+    # (load generation, {category -> lines})
+    loaded = pyqtSignal(int, dict)
+    # (load generation, error message; empty when the file is not a template workbook)
+    failed = pyqtSignal(int, str)
+
+
+class SessionLoadTask(QRunnable):
+    """
+    REQUIRES: constructed on the GUI thread
+    MODIFIES: none (reads the session file)
+    EFFECTS:  Builds the category lines on a pool thread and emits signals.loaded, or
+              signals.failed if the read fails; Qt delivers both queued to receivers on
+              the GUI thread. The task holds no reference to any widget, so a window
+              closed mid-load is never released from the worker.
+    """
+
+    def __init__(self, session_path: str, generation: int, categories: List[str]) -> None:
+        super().__init__()
+        self.signals = SessionLoadSignals()
+        self._session_path = session_path
+        self._generation = generation
+        self._categories = categories
+
+    def run(self) -> None:
+        try:
+            buckets = read_session_lines(self._session_path, self._categories)
+        except Exception as e:
+            self.signals.failed.emit(self._generation, str(e))
+            return
+        if buckets is None:
+            self.signals.failed.emit(self._generation, "")
+            return
+        self.signals.loaded.emit(self._generation, buckets)
+
+
 class MainWindow(QWidget):
     """
     REQUIRES: QApplication is running.
@@ -26,16 +91,21 @@ class MainWindow(QWidget):
         self.session_path: Optional[str] = session_path
         self._screen_manager = getattr(self, "_screen_manager", None)
 
-        self._category_lists: Dict[str, QListWidget] = {}
-        self._categories: List[str] = [
+        self._category_lists: Dict[str, QListView] = {}
+        self._category_models: Dict[str, CategoryListModel] = {}
+        # Interned like the loader's category strings, so bucket lookups hit on identity.
+        self._categories: List[str] = [sys.intern(name) for name in (
             "HOUSING", "TRANSPORTATION", "INSURANCE", "SCHOOL", "FOOD",
             "PERSONAL CARE", "SUBSCRIPTIONS", "HOLIDAY EXPENSES", "MISCELLANEOUS",
             "INCOME", "NONE",
-        ]
+        )]
+        # Bumped per load request so results from superseded loads are dropped.
+        self._load_generation: int = 0
 
         self.build_ui()
         self.setWindowState(self.windowState() | Qt.WindowMaximized)
-        self.load_session_into_lists()
+        # Start the load after the first paint; the lists show "Loading…" until then.
+        QTimer.singleShot(0, self.load_session_into_lists)
 
     def build_ui(self) -> None:
         """
@@ -48,7 +118,7 @@ class MainWindow(QWidget):
         root.setContentsMargins(18, 18, 18, 18)
         root.setSpacing(12)
 
-        title = LabelCreator().create(text="Money Manager — Categories", alignment=Qt.AlignCenter)
+        title = LABEL_CREATOR.create(text="Money Manager — Categories", alignment=Qt.AlignCenter)
         title.setFont(QFont("Arial", 20, QFont.Bold))
         root.addWidget(title)
 
@@ -76,14 +146,14 @@ class MainWindow(QWidget):
         bottom = QHBoxLayout()
         bottom.setSpacing(16)
 
-        self.btn_profile = ButtonCreator().create(text="👤", min_width=72, min_height=56)
+        self.btn_profile = BUTTON_CREATOR.create(text="👤", min_width=72, min_height=56)
         bottom.addWidget(self.btn_profile, 0, Qt.AlignLeft)
 
         center_stack = QVBoxLayout()
         center_stack.setSpacing(8)
-        self.btn_charts = ButtonCreator().create(text="View Charts", min_height=40)
-        self.btn_ai = ButtonCreator().create(text="AI Assistant", min_height=40)
-        self.btn_back = ButtonCreator().create(text="Home", min_height=40)
+        self.btn_charts = BUTTON_CREATOR.create(text="View Charts", min_height=40)
+        self.btn_ai = BUTTON_CREATOR.create(text="AI Assistant", min_height=40)
+        self.btn_back = BUTTON_CREATOR.create(text="Home", min_height=40)
         center_stack.addWidget(self.btn_charts)
         center_stack.addWidget(self.btn_ai)
         center_stack.addWidget(self.btn_back)
@@ -91,7 +161,7 @@ class MainWindow(QWidget):
         bottom.addLayout(center_stack, 0)
         bottom.addStretch(1)
 
-        self.btn_add = ButtonCreator().create(text="+", min_width=72, min_height=56)
+        self.btn_add = BUTTON_CREATOR.create(text="+", min_width=72, min_height=56)
         bottom.addWidget(self.btn_add, 0, Qt.AlignRight)
 
         self.btn_back.clicked.connect(self.on_home_clicked)
@@ -127,74 +197,85 @@ class MainWindow(QWidget):
         """
         REQUIRES: category name key
         MODIFIES: self
-        EFFECTS:  Returns a QGroupBox with a QListWidget placeholder.
+        EFFECTS:  Returns a QGroupBox with a QListView over an empty CategoryListModel.
         """
         box = QGroupBox(name)
         box_layout = QVBoxLayout(box)
         box_layout.setContentsMargins(8, 8, 8, 8)
         box_layout.setSpacing(6)
 
-        lst = QListWidget()
+        placeholder = CategoryListModel.LOADING if self.session_path else CategoryListModel.PLACEHOLDER
+        model = CategoryListModel(self, placeholder)
+        lst = QListView()
         lst.setObjectName(f"list_{name.replace(' ', '_')}")
         lst.setMinimumHeight(140)
         lst.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        placeholder = QListWidgetItem("— No entries yet —")
-        placeholder.setFlags(Qt.NoItemFlags)
-        lst.addItem(placeholder)
+        # One-line rows: skip per-row size hints and lay out in batches.
+        lst.setUniformItemSizes(True)
+        lst.setLayoutMode(QListView.Batched)
+        lst.setBatchSize(64)
+        lst.setVerticalScrollMode(QListView.ScrollPerPixel)
+        lst.setModel(model)
 
         self._category_lists[name] = lst
+        self._category_models[name] = model
         box_layout.addWidget(lst)
         return box
 
     def load_session_into_lists(self) -> None:
         """
         REQUIRES: session_path is set
-        MODIFIES: UI lists
-        EFFECTS:  Reads workbook and populates category lists.
+        MODIFIES: self (load generation); UI lists when there is no session
+        EFFECTS:  Starts reading the workbook on a pool thread; the category lists are
+                  repopulated by on_session_loaded once the read completes. Without a
+                  session, any pending load is abandoned and the lists show PLACEHOLDER.
         """
+        self._load_generation += 1
         if not self.session_path:
+            self.show_placeholders()
             return
-        try:
-            loader = ExcelLoader()
-            loader.open(self.session_path)
-            if not loader.verify_template():
-                loader.close()
-                return
-            all_data = loader.read_all()
-            loader.close()
-        except Exception as e:
-            print(f"[error] Failed to load session data: {e}")
+        task = SessionLoadTask(self.session_path, self._load_generation, list(self._categories))
+        task.signals.loaded.connect(self.on_session_loaded)
+        task.signals.failed.connect(self.on_session_load_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def on_session_loaded(self, generation: int, buckets: Dict[str, List[str]]) -> None:
+        """
+        REQUIRES: called on the GUI thread (queued from SessionLoadTask)
+        MODIFIES: UI lists
+        EFFECTS:  Hands each category model its rows in one reset, unless a newer load
+                  has been requested since.
+        """
+        if generation != self._load_generation:
             return
+        for name, lines in buckets.items():
+            self._category_models[name].set_rows(lines)
+
+    def on_session_load_failed(self, generation: int, message: str) -> None:
+        """
+        REQUIRES: called on the GUI thread (queued from SessionLoadTask)
+        MODIFIES: UI lists
+        EFFECTS:  Unless a newer load has been requested since, resets the lists to
+                  PLACEHOLDER and reports message (if any) in a warning box.
+        """
+        if generation != self._load_generation:
+            return
+        self.show_placeholders()
+        if message:
+            QMessageBox.warning(self, "Load Error", f"Failed to load session data.\n\n{message}")
+
+    def show_placeholders(self) -> None:
+        """
+        REQUIRES: build_ui() has run
+        MODIFIES: UI lists
+        EFFECTS:  Resets every category model to the empty PLACEHOLDER row.
+        """
+        for model in self._category_models.values():
+            model.show_placeholder()
 
-        for lst in self._category_lists.values():
-            lst.clear()
-
-        for _, days in all_data.items():
-            for _, slots in days.items():
-                for tx in slots:
-                    if tx is None:
-                        continue
-                    target_name = (tx.category or "").strip().upper()
-                    if tx.type.strip().upper() == "INCOME":
-                        target_name = "INCOME"
-                    if target_name not in self._category_lists:
-                        target_name = "MISCELLANEOUS"
-
-                    lst = self._category_lists[target_name]
-                    amount_str = format_currency(tx.amount)
-                    line = f"{tx.date}  •  {tx.day or '-'}  •  {amount_str}  •  {tx.type}  •  {tx.description or ''}"
-                    lst.addItem(QListWidgetItem(line))
-
-        for _, lst in self._category_lists.items():
-            if lst.count() == 0:
-                placeholder = QListWidgetItem("— No entries yet —")
-                placeholder.setFlags(Qt.NoItemFlags)
-                lst.addItem(placeholder)
-
-    def get_category_list(self, name: str) -> QListWidget:
+    def get_category_list(self, name: str) -> QListView:
         """
         REQUIRES: name corresponds to a known category key
-        EFFECTS:  Returns the QListWidget for that category.
+        EFFECTS:  Returns the QListView for that category.
         """
         return self._category_lists[name]
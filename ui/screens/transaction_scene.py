@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Dict, Optional, Tuple
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import QTimer, pyqtSignal
+from PyQt5.QtGui import QCloseEvent
 from PyQt5.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QComboBox,
     QDoubleSpinBox, QSpinBox, QLineEdit, QPushButton, QMessageBox
 )
 
 from models.transaction import Transaction
-from file_io.excel_loader import ExcelLoader
+from file_io.excel_loader import ExcelLoader, MONTH_INDEX
 from utils.validator import (
     ValidationError,
     validate_month_name,
@@ -33,6 +35,9 @@ class TransactionScene(QDialog):
         super().__init__(parent)
         self.session_path: Optional[str] = session_path
         self._working_set: Dict[Tuple[str, int, int], Optional[Transaction]] = {}
+        # Loader reused across Add/Save while the session file is unchanged on disk.
+        self._loader: Optional[ExcelLoader] = None
+        self._loader_stamp: Optional[Tuple[int, int]] = None
 
         self.setWindowTitle("Edit Transactions")
         self.setModal(True)
@@ -111,6 +116,14 @@ class TransactionScene(QDialog):
         btns.addWidget(self.btn_close)
 
         root.addLayout(btns)
+
+        # Non-modal feedback for queued changes; cleared a moment after each message.
+        self.lbl_status = QLabel("")
+        root.addWidget(self.lbl_status)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self.lbl_status.clear)
+
         self.setLayout(root)
 
         self.btn_add.clicked.connect(self.on_add_clicked)
@@ -174,16 +187,14 @@ class TransactionScene(QDialog):
             return
         if type_key == "NONE" and category_key == "NONE":
             self._working_set[(month_key, day, slot)] = None
-            QMessageBox.information(self, "Queued", "Clear operation queued for save.")
+            self.flash_status("Clear operation queued for save.")
             return
 
         try:
-            loader = ExcelLoader()
-            loader.open(self.session_path)
+            loader = self.session_loader()
             year = loader.get_year()
             validate_day_in_month(month_key, year, day)
             month_num = loader.month_to_number(month_key)
-            loader.close()
         except Exception as e:
             QMessageBox.warning(self, "Invalid Day", str(e))
             return
@@ -204,7 +215,7 @@ class TransactionScene(QDialog):
             return
 
         self._working_set[(month_key, day, slot)] = tx
-        QMessageBox.information(self, "Queued", "Transaction queued for save.")
+        self.flash_status("Transaction queued for save.")
 
     def on_remove_clicked(self) -> None:
         """
@@ -217,7 +228,16 @@ class TransactionScene(QDialog):
             return
         month_key, day, slot = self.current_key()
         self._working_set[(month_key, day, slot)] = None
-        QMessageBox.information(self, "Queued", "Removal queued for save.")
+        self.flash_status("Removal queued for save.")
+
+    def flash_status(self, message: str, timeout_ms: int = 1500) -> None:
+        """
+        REQUIRES: none
+        MODIFIES: status label
+        EFFECTS:  Shows message in the status line and clears it after timeout_ms.
+        """
+        self.lbl_status.setText(message)
+        self._status_timer.start(timeout_ms)
 
     def on_save_clicked(self) -> None:
         """
@@ -234,14 +254,67 @@ class TransactionScene(QDialog):
             return
 
         try:
-            loader = ExcelLoader()
-            loader.open(self.session_path)
-            for (month_key, day, slot), tx in self._working_set.items():
-                loader.write_day_entry(month_key, day, slot, tx)
+            loader = self.session_loader()
+            loader.ensure_writable()
+            year = loader.get_year()
+            # Keys were normalized by current_key(); write in sheet order with one year read.
+            queued = sorted(
+                self._working_set.items(),
+                key=lambda kv: (MONTH_INDEX[kv[0][0]], kv[0][1], kv[0][2]),
+            )
+            for (month_key, day, slot), tx in queued:
+                loader.write_slot(month_key, year, day, slot, tx)
             loader.save()
-            loader.close()
+            self._loader_stamp = loader.file_stamp()
             self._working_set.clear()
             self.saved.emit()
             QMessageBox.information(self, "Saved", "Changes saved successfully.")
         except Exception as e:
+            # Drop partially applied writes; the next use reopens from disk.
+            self.release_loader()
             QMessageBox.warning(self, "Save Error", str(e))
+
+    def session_loader(self) -> ExcelLoader:
+        """
+        REQUIRES: session_path is set
+        MODIFIES: self
+        EFFECTS:  Returns the loader for the session file, (re)opening it if none is held
+                  or the file changed on disk since it was loaded/saved. It opens
+                  read-only and upgrades itself to writable on the first write.
+        """
+        path = str(Path(self.session_path).resolve())  # type: ignore[arg-type]
+        loader = self._loader
+        if loader is None or loader.get_path() != path or loader.file_stamp() != self._loader_stamp:
+            self.release_loader()
+            loader = ExcelLoader()
+            loader.open(path, read_only=True)
+            self._loader = loader
+            self._loader_stamp = loader.file_stamp()
+        return loader
+
+    def release_loader(self) -> None:
+        """
+        MODIFIES: self
+        EFFECTS:  Drops the held loader (unsaved writes are discarded).
+        """
+        if self._loader is not None:
+            self._loader.close()
+        self._loader = None
+        self._loader_stamp = None
+
+    def done(self, result: int) -> None:
+        """
+        MODIFIES: self
+        EFFECTS:  Releases the held workbook when the dialog is accepted or rejected
+                  (including Esc, which hides the dialog without a closeEvent).
+        """
+        self.release_loader()
+        super().done(result)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        MODIFIES: self
+        EFFECTS:  Releases the held workbook when the dialog closes.
+        """
+        self.release_loader()
+        super().closeEvent(event)
@@ -19,8 +19,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QPixmap, QFont
 from PyQt5.QtCore import Qt
 
-from ui.widget_factory.concrete.button_creator import ButtonCreator
-from ui.widget_factory.concrete.label_creator import LabelCreator
+from ui.widget_factory.concrete.button_creator import BUTTON_CREATOR
+from ui.widget_factory.concrete.label_creator import LABEL_CREATOR
 
 from utils.validator import ValidationError, validate_download_target_path
 
@@ -32,6 +32,9 @@ class WelcomeScreen(QWidget):
     EFFECTS:  Provides actions to start/import a session or download the template.
     """
 
+    # Scaled logo shared by every WelcomeScreen (built on first use, after QApplication exists)
+    _logo_pixmap: Optional[QPixmap] = None
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._screen_manager = getattr(self, "_screen_manager", None)  # injected externally
@@ -50,20 +53,19 @@ class WelcomeScreen(QWidget):
         layout.setAlignment(Qt.AlignCenter)
 
         logo_label = QLabel()
-        pixmap = QPixmap("resources/logo.png")
-        logo_label.setPixmap(pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_label.setPixmap(self.logo_pixmap())
         logo_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(logo_label)
 
-        title_label = LabelCreator().create(text="Welcome to Money Manager", alignment=Qt.AlignCenter)
+        title_label = LABEL_CREATOR.create(text="Welcome to Money Manager", alignment=Qt.AlignCenter)
         title_label.setFont(QFont("Arial", 18, QFont.Bold))
         layout.addWidget(title_label)
 
         layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
 
-        self.btn_continue = ButtonCreator().create(text="Continue Without File", min_height=40)
-        self.btn_upload = ButtonCreator().create(text="Upload Excel File", min_height=40)
-        self.btn_download_template = ButtonCreator().create(text="Download Template", min_height=40)
+        self.btn_continue = BUTTON_CREATOR.create(text="Continue Without File", min_height=40)
+        self.btn_upload = BUTTON_CREATOR.create(text="Upload Excel File", min_height=40)
+        self.btn_download_template = BUTTON_CREATOR.create(text="Download Template", min_height=40)
 
         for btn in (self.btn_continue, self.btn_upload, self.btn_download_template):
             layout.addWidget(btn)
@@ -71,6 +73,18 @@ class WelcomeScreen(QWidget):
         layout.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
         self.setLayout(layout)
 
+    def logo_pixmap(self) -> QPixmap:
+        """
+        REQUIRES: QApplication is running
+        MODIFIES: WelcomeScreen (class-level logo cache)
+        EFFECTS:  Returns the 150x150 logo, decoding and scaling it only once per process.
+        """
+        cls = type(self)
+        if cls._logo_pixmap is None:
+            pixmap = QPixmap("resources/logo.png")
+            cls._logo_pixmap = pixmap.scaled(150, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return cls._logo_pixmap
+
     def wire_actions(self) -> None:
         """
         REQUIRES: build_ui() has created buttons.
@@ -40,3 +40,7 @@ class ButtonCreator(WidgetCreatorInterface):
             btn.clicked.connect(on_click)
         btn.setCursor(Qt.PointingHandCursor)
         return btn
+
+
+# Shared stateless creator; screens use this instead of instantiating their own.
+BUTTON_CREATOR: ButtonCreator = ButtonCreator()
@@ -34,3 +34,7 @@ class LabelCreator(WidgetCreatorInterface):
         if object_name:
             lbl.setObjectName(object_name)
         return lbl
+
+
+# Shared stateless creator; screens use this instead of instantiating their own.
+LABEL_CREATOR: LabelCreator = LabelCreator()
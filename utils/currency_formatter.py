@@ -7,6 +7,7 @@ Very small helper for displaying money consistently.
 - If the value has cents, shows 2 decimals; otherwise no decimals.
 """
 
+from functools import lru_cache
 from typing import Union
 
 Number = Union[int, float]
@@ -17,11 +18,20 @@ def format_currency(amount: Number) -> str:
     REQUIRES: amount >= 0 (app logic ensures non-negative)
     EFFECTS: Returns "$1,234" for whole numbers, "$1,234.56" if cents exist.
     """
+    if type(amount) is int:
+        # Whole dollars need no coercion; 5 and 5.0 share one cache entry.
+        return _format_value(amount)
     try:
         val = float(amount)
     except (TypeError, ValueError):
         val = 0.0
+    return _format_value(val)
 
+
+# Transaction lists repeat the same few amounts; reuse their strings.
+@lru_cache(maxsize=2048)
+def _format_value(val: Number) -> str:
+    """EFFECTS: Formats a numeric amount as described in format_currency."""
     if val < 0:
         # App design uses only non-negative amounts; guard anyway.
         val = 0.0
@@ -38,6 +48,4 @@ class CurrencyFormatter:
         CurrencyFormatter.format(1234) -> "$1,234"
     """
 
-    @staticmethod
-    def format(amount: Number) -> str:
-        return format_currency(amount)
+    format = staticmethod(format_currency)
@@ -12,10 +12,25 @@ Representation Invariant:
       or modify external variables.
 """
 
+from functools import lru_cache
+
+
+# Days per month in calendar order (February as in a common year)
+MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Lower-case month name -> 0-based position in MONTH_DAYS
+MONTH_POSITION = {
+    name: i for i, name in enumerate((
+        "january", "february", "march", "april", "may", "june",
+        "july", "august", "september", "october", "november", "december",
+    ))
+}
+
 
 class GeneralHelper:
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def get_days_in_month(month: str, year: int) -> int:
         """
         REQUIRES:
@@ -24,35 +39,21 @@ class GeneralHelper:
         EFFECTS:
             - Returns the number of days in the given month for the given year.
               February is 29 days in leap years, 28 otherwise.
+            - Results are memoized per (month, year) argument pair.
         """
-        # Normalize month to lowercase for comparison
+        # Normalize month to lowercase for lookup
         month = month.strip().lower()
 
-        # Mapping of months to days (default for February is 28)
-        month_days = {
-            "january": 31,
-            "february": 28,
-            "march": 31,
-            "april": 30,
-            "may": 31,
-            "june": 30,
-            "july": 31,
-            "august": 31,
-            "september": 30,
-            "october": 31,
-            "november": 30,
-            "december": 31
-        }
-
         # Validate month
-        if month not in month_days:
+        i = MONTH_POSITION.get(month)
+        if i is None:
             raise ValueError(f"Invalid month name: {month}")
 
         # Adjust February for leap year
-        if month == "february" and GeneralHelper.is_leap_year(year):
+        if i == 1 and GeneralHelper.is_leap_year(year):
             return 29
 
-        return month_days[month]
+        return MONTH_DAYS[i]
 
     @staticmethod
     def is_leap_year(year: int) -> bool:
@@ -60,4 +61,5 @@ class GeneralHelper:
         REQUIRES: year is a positive integer
         EFFECTS: Returns True if the given year is a leap year, False otherwise.
         """
-        return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+        # year & 3 tests divisibility by 4; most years stop there.
+        return (year & 3) == 0 and (year % 100 != 0 or year % 400 == 0)
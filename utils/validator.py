@@ -11,17 +11,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 import os
+import re
 import tempfile
-import datetime
-
-# Use openpyxl directly for template signature checks to avoid circular imports
-from openpyxl import load_workbook
 
 from models.transaction import Transaction
-from utils.general_helper import GeneralHelper
+from utils.general_helper import GeneralHelper, MONTH_DAYS
 
 
 # --------------------------- Error Type ---------------------------
@@ -39,10 +37,28 @@ class ValidationError(Exception):
 
 _TEMPLATE_MARKER_CELL = "A1"
 _TEMPLATE_MARKER_VALUE = "MM_TMU"
-_MONTH_KEYS = {
+
+# (absolute path, st_mtime_ns, st_size) of files that passed the marker check;
+# an edited file gets a new stamp and is checked again.
+_VALID_TEMPLATE_STAMPS: Set[Tuple[str, int, int]] = set()
+_VALID_TEMPLATE_STAMPS_MAX_ENTRIES = 64
+_MONTH_KEYS = frozenset({
     "JANUARY","FEBRUARY","MARCH","APRIL","MAY","JUNE",
     "JULY","AUGUST","SEPTEMBER","OCTOBER","NOVEMBER","DECEMBER"
+})
+_TX_TYPES = frozenset({"INCOME", "EXPENSE"})
+
+# Raw month input -> normalized key. Preloaded with the usual spellings; other
+# valid inputs are added on first use (bounded by _MONTH_NORM_MAX_ENTRIES).
+_MONTH_NORM: Dict[str, str] = {
+    spelling: key
+    for key in _MONTH_KEYS
+    for spelling in (key, key.title(), key.lower())
 }
+_MONTH_NORM_MAX_ENTRIES = 256
+
+# YYYY-MM-DD with the field forms datetime.strptime("%Y-%m-%d") accepts
+_ISO_DATE = re.compile(r"(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])")
 
 # Local month -> number map (kept here to avoid coupling)
 _MONTH_TO_NUM = {
@@ -61,7 +77,7 @@ def validate_fresh_session_paths(template_path: str, storage_dir: str) -> None:
     tpath = Path(template_path)
     sdir = Path(storage_dir)
 
-    if not tpath.exists() or not tpath.is_file():
+    if not tpath.is_file():  # False for missing paths too (one stat)
         raise ValidationError(f"Template not found at: {tpath}")
     if tpath.suffix.lower() != ".xlsx":
         raise ValidationError("Template must be an .xlsx file.")
@@ -75,10 +91,11 @@ def validate_user_upload_path(file_path: str) -> None:
         raise ValidationError("Please select an Excel file (.xlsx).")
 
     fpath = Path(file_path)
-    if not fpath.exists() or not fpath.is_file():
+    if not fpath.is_file():
         raise ValidationError(f"File not found at: {fpath}")
     if fpath.suffix.lower() != ".xlsx":
         raise ValidationError("Selected file must have a .xlsx extension.")
+    # os.access, not a st_mode bit test: it checks the real uid and honours ACLs.
     if not os.access(str(fpath), os.R_OK):
         raise ValidationError(f"You do not have permission to read this file:\n{fpath}")
 
@@ -86,11 +103,26 @@ def validate_user_upload_path(file_path: str) -> None:
 def validate_template_signature(file_path: str) -> None:
     """Opens the workbook and checks the Money Manager template marker."""
     try:
-        wb = load_workbook(filename=str(file_path))
-        ws = wb.active
-        marker = ws[_TEMPLATE_MARKER_CELL].value  # type: ignore[index]
-        ok = str(marker or "").strip().upper() == _TEMPLATE_MARKER_VALUE
-        wb.save(str(file_path))  # ensure handles are closed
+        st = os.stat(file_path)
+        stamp: Optional[Tuple[str, int, int]] = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    except (OSError, TypeError, ValueError):
+        stamp = None
+    if stamp is not None and stamp in _VALID_TEMPLATE_STAMPS:
+        return
+
+    # Use openpyxl directly (not ExcelLoader) to avoid circular imports; imported
+    # here so importing the validators does not pull in openpyxl.
+    from openpyxl import load_workbook
+
+    try:
+        # Read-only: only A1 is needed, and the user's file must not be rewritten.
+        wb = load_workbook(filename=str(file_path), read_only=True, data_only=True, keep_links=False)
+        try:
+            ws = wb.active
+            marker = ws[_TEMPLATE_MARKER_CELL].value  # type: ignore[index]
+            ok = str(marker or "").strip().upper() == _TEMPLATE_MARKER_VALUE
+        finally:
+            wb.close()  # read-only workbooks hold the file open until closed
     except Exception as e:
         raise ValidationError(f"Could not open the selected file.\n\n{e}")
 
@@ -99,6 +131,10 @@ def validate_template_signature(file_path: str) -> None:
             "This file doesn't match the Money Manager template "
             f"(missing '{_TEMPLATE_MARKER_VALUE}' marker in cell {_TEMPLATE_MARKER_CELL})."
         )
+    if stamp is not None:
+        if len(_VALID_TEMPLATE_STAMPS) >= _VALID_TEMPLATE_STAMPS_MAX_ENTRIES:
+            _VALID_TEMPLATE_STAMPS.clear()
+        _VALID_TEMPLATE_STAMPS.add(stamp)
 
 
 def validate_download_target_path(save_path: str) -> None:
@@ -123,8 +159,7 @@ def validate_export_target_path(target_path: str, active_session_path: Optional[
         return
 
     try:
-        session_file = Path(active_session_path).resolve()
-        storage_directory = session_file.parent
+        storage_directory = session_storage_dir(str(active_session_path))
         target = Path(target_path).resolve()
         try:
             target.relative_to(storage_directory)
@@ -147,7 +182,7 @@ def validate_open_excel_path(file_path: str) -> None:
     if not file_path or str(file_path).strip() == "":
         raise ValidationError("Please provide a workbook path to open.")
     fpath = Path(file_path)
-    if not fpath.exists() or not fpath.is_file():
+    if not fpath.is_file():
         raise ValidationError(f"Workbook not found at: {fpath}")
     if fpath.suffix.lower() != ".xlsx":
         raise ValidationError("Workbook must be an .xlsx file.")
@@ -181,11 +216,17 @@ def validate_income_value(amount: float) -> None:
 
 def validate_month_name(month_name: str) -> str:
     """Normalize + validate month name against template months."""
+    if type(month_name) is str:
+        cached = _MONTH_NORM.get(month_name)
+        if cached is not None:
+            return cached
     if not month_name or str(month_name).strip() == "":
         raise ValidationError("Month name is required.")
     key = str(month_name).strip().upper()
     if key not in _MONTH_KEYS:
         raise ValidationError("Unknown month name. Use January–December.")
+    if type(month_name) is str and len(_MONTH_NORM) < _MONTH_NORM_MAX_ENTRIES:
+        _MONTH_NORM[month_name] = key
     return key
 
 
@@ -224,9 +265,12 @@ def validate_transaction_or_none(tx: Optional[Transaction]) -> None:
     if amt < 0:
         raise ValidationError("Transaction amount must be non-negative.")
 
-    t = str(getattr(tx, "type", "")).strip().upper()
-    if t not in {"INCOME", "EXPENSE"}:
-        raise ValidationError("Transaction type must be INCOME or EXPENSE.")
+    t = getattr(tx, "type", "")
+    # Transactions carry canonical type strings; only odd spellings need normalizing.
+    if type(t) is not str or t not in _TX_TYPES:
+        t = str(t).strip().upper()
+        if t not in _TX_TYPES:
+            raise ValidationError("Transaction type must be INCOME or EXPENSE.")
 
     cat = str(getattr(tx, "category", "")).strip()
     if cat == "":
@@ -235,9 +279,7 @@ def validate_transaction_or_none(tx: Optional[Transaction]) -> None:
     date_s = str(getattr(tx, "date", "")).strip()
     if date_s == "":
         raise ValidationError("Transaction date is required (YYYY-MM-DD).")
-    try:
-        datetime.datetime.strptime(date_s, "%Y-%m-%d")
-    except Exception:
+    if parse_iso_date(date_s) is None:
         raise ValidationError("Invalid date format. Expected YYYY-MM-DD.")
 
 
@@ -260,23 +302,21 @@ def validate_import_into_session(loader, source_path: str) -> None:
 
 def validate_date_matches_month(month_key: str, date_str: str, year: int) -> None:
     """Ensures tx.date’s year/month matches the target month section."""
-    try:
-        d = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-    except Exception:
+    ymd = parse_iso_date(date_str) if isinstance(date_str, str) else None
+    if ymd is None:
         raise ValidationError("Invalid transaction date. Expected YYYY-MM-DD.")
     month_num = _MONTH_TO_NUM.get(str(month_key).strip().upper())
     if month_num is None:
         raise ValidationError("Unknown month name. Use January–December.")
-    if d.year != int(year) or d.month != month_num:
+    if ymd[0] != int(year) or ymd[1] != month_num:
         raise ValidationError(f"Date {date_str} does not belong to {month_key} {year}.")
 
 
 def validate_upload_filesize(file_path: str, max_mb: int = 20) -> None:
     """Reject absurdly large uploads (> max_mb)."""
-    fpath = Path(file_path)
-    size_mb = fpath.stat().st_size / (1024 * 1024)
-    if size_mb > max_mb:
-        raise ValidationError(f"Upload too large ({size_mb:.1f} MB). Limit is {max_mb} MB.")
+    size = os.path.getsize(file_path)
+    if size > max_mb * 1024 * 1024:
+        raise ValidationError(f"Upload too large ({size / (1024 * 1024):.1f} MB). Limit is {max_mb} MB.")
 
 
 def validate_active_session(session_path: Optional[str]) -> None:
@@ -287,11 +327,40 @@ def validate_active_session(session_path: Optional[str]) -> None:
 
 # --------------------------- Helpers -----------------------------
 
-def ensure_directory_writable(directory: Path) -> None:
+@lru_cache(maxsize=8)
+def session_storage_dir(session_path: str) -> Path:
+    """EFFECTS: Returns the resolved folder holding session_path (memoized; sessions rarely move)."""
+    return Path(session_path).resolve().parent
+
+
+def parse_iso_date(date_s: str) -> Optional[Tuple[int, int, int]]:
+    """
+    EFFECTS: Returns (year, month, day) if date_s is a real calendar date in the
+             form datetime.strptime(date_s, "%Y-%m-%d") accepts; else None.
+    """
+    m = _ISO_DATE.fullmatch(date_s)
+    if m is None:
+        return None
+    y, mo, d = int(m[1]), int(m[2]), int(m[3])
+    if y < 1:
+        return None
+    if d > MONTH_DAYS[mo - 1] and not (mo == 2 and d == 29 and GeneralHelper.is_leap_year(y)):
+        return None
+    return y, mo, d
+
+
+def ensure_directory_writable(directory: Path, exhaustive: bool = False) -> None:
+    """
+    Creates directory if needed and checks that files can be written into it.
+    On POSIX, access() answers for the common case; a positive answer from it on
+    Windows ignores ACLs, so there (or with exhaustive=True) a temp file is created.
+    """
     try:
         directory.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         raise ValidationError(f"Cannot create directory:\n{directory}\n\n{e}")
+    if not exhaustive and os.name == "posix" and os.access(str(directory), os.W_OK | os.X_OK):
+        return
     try:
         with tempfile.TemporaryFile(dir=str(directory)):
             pass